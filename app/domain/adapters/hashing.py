@@ -3,9 +3,9 @@ from abc import ABC, abstractmethod
 
 class IHashService(ABC):
     @abstractmethod
-    def hash(self, plain_text: str) -> str:
+    async def hash(self, plain_text: str) -> str:
         pass
 
     @abstractmethod
-    def verify(self, plain_text: str, hashed_text: str) -> bool:
+    async def verify(self, plain_text: str, hashed_text: str) -> bool:
         pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ITokenDigestService(ABC):
+    @abstractmethod
+    async def digest(self, token: str) -> str:
+        pass
+
+    @abstractmethod
+    async def verify(self, token: str, stored_digest: Optional[str]) -> bool:
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ITokenRevocationService(ABC):
+    @abstractmethod
+    async def revoke(self, payload: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    async def is_revoked(self, jti: str, expires_at: Optional[float] = None) -> bool:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, Iterable, List, Optional, Callable, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 Query = Dict[str, Any]
@@ -19,6 +19,17 @@ class IBaseCrudRepository(ABC):
     ) -> Any:
         pass
 
+    @abstractmethod
+    async def update_fields(
+        self,
+        id: Any,
+        data: Dict[str, Any],
+        *,
+        returning: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> Any:
+        pass
+
     @abstractmethod
     async def upsert(
         self, data: Dict[str, Any], session: Optional[AsyncSession] = None
@@ -35,6 +46,26 @@ class IBaseCrudRepository(ABC):
     ) -> int:
         pass
 
+    @abstractmethod
+    async def bulk_create(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def bulk_upsert(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, int]:
+        pass
+
     @abstractmethod
     async def soft_delete(self, id: Any, session: Optional[AsyncSession] = None) -> Any:
         pass
@@ -56,6 +87,23 @@ class IBaseCrudRepository(ABC):
     ) -> Optional[Any]:
         pass
 
+    @abstractmethod
+    async def find_one_from_primary(
+        self,
+        filter_: Dict[str, Any],
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def find_one_with_secret(
+        self,
+        filter_: Dict[str, Any],
+        column: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Tuple[Optional[Any], Any]:
+        pass
+
     @abstractmethod
     async def paginate(
         self,
@@ -65,3 +113,15 @@ class IBaseCrudRepository(ABC):
         session: Optional[AsyncSession] = None,
     ) -> Dict[str, Any]:
         pass
+
+    @abstractmethod
+    async def paginate_keyset(
+        self,
+        query_builder_func: Optional[Callable[[AsyncSession], Any]] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        sort_keys: Sequence[Tuple[str, str]] = (("created_at", "asc"), ("id", "asc")),
+        with_total: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, Any]:
+        pass
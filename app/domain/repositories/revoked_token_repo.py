@@ -0,0 +1,33 @@
+import datetime
+from abc import abstractmethod
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.base_crud_repo import IBaseCrudRepository
+
+
+class IRevokedTokenRepository(IBaseCrudRepository):
+    @abstractmethod
+    async def revoke(
+        self,
+        jti: str,
+        user_id: str,
+        expires_at: datetime.datetime,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def find_active(
+        self, since: Optional[datetime.datetime] = None
+    ) -> List[Tuple[str, datetime.datetime]]:
+        pass
+
+    @abstractmethod
+    async def prune_expired(self) -> int:
+        pass
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional
+
+from app.infrastructure.common.cache.ttl_lru_cache import TTLLRUCache
+
+
+class ICacheBackend(ABC):
+    """Key/value store used by the repository caches.
+
+    Values are plain dicts of column values so that a shared backend only has
+    to serialize them; methods are async for the same reason.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        pass
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    """Per-process backend with TTL and LRU eviction."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._cache = TTLLRUCache(max_size=max_entries, ttl=ttl_seconds)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Literal, Optional
 
 
 class BasePaginationQueryDTO(BaseModel):
@@ -8,3 +8,12 @@ class BasePaginationQueryDTO(BaseModel):
     search: Optional[str] = Field(None, description="Search query string")
     sort: Optional[str] = Field(None, description="Sort order (e.g. 'asc', 'desc')")
     filter: Optional[dict] = Field(None, description="Filter criteria")
+    pagination: Literal["offset", "keyset"] = Field(
+        "offset", description="Offset (page number) or keyset (cursor) pagination"
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque cursor from a previous keyset page"
+    )
+    with_total: bool = Field(
+        False, description="Also count all matching rows in keyset mode"
+    )
@@ -6,8 +6,10 @@ T = TypeVar("T")
 
 class BasePaginationResponseDto(GenericModel, Generic[T]):
     items: List[T]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
     has_next: Optional[bool] = False
     has_prev: Optional[bool] = False
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
@@ -0,0 +1,156 @@
+import time
+from typing import Any, Type
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool
+
+from app.infrastructure.common.cache.cache_backend import ICacheBackend
+from app.infrastructure.common.metrics.registry import MetricsRegistry
+from app.infrastructure.configs.app_config import app_settings
+
+registry = MetricsRegistry(app_settings.metrics_multiprocess_dir or None)
+
+# --- HTTP ---
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+
+# --- Database pool ---
+db_pool_checkouts_total = registry.counter(
+    "db_pool_checkouts_total",
+    "Connections checked out of the pool.",
+    ("engine",),
+)
+db_pool_connects_total = registry.counter(
+    "db_pool_connects_total",
+    "New DBAPI connections opened by the pool.",
+    ("engine",),
+)
+db_pool_size = registry.gauge("db_pool_size", "Configured pool size.", ("engine",))
+db_pool_checked_out = registry.gauge(
+    "db_pool_checked_out", "Connections currently checked out.", ("engine",)
+)
+db_pool_checked_in = registry.gauge(
+    "db_pool_checked_in", "Idle connections held by the pool.", ("engine",)
+)
+db_pool_overflow = registry.gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is filling).",
+    ("engine",),
+)
+db_pool_checkout_seconds = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time to obtain a pooled connection, including waiting for a free one.",
+    ("engine",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+# --- Caches ---
+cache_lookups_total = registry.counter(
+    "cache_lookups_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ("cache", "result"),
+)
+cache_evictions_total = registry.counter(
+    "cache_evictions_total",
+    "Entries evicted to stay within the cache size limit.",
+    ("cache",),
+)
+cache_entries = registry.gauge(
+    "cache_entries", "Entries currently held by the cache.", ("cache",)
+)
+
+# --- Password hashing ---
+bcrypt_calls_total = registry.counter(
+    "bcrypt_calls_total",
+    "bcrypt operations by operation and outcome.",
+    ("operation", "outcome"),
+)
+bcrypt_duration_seconds = registry.histogram(
+    "bcrypt_duration_seconds",
+    "Time spent inside bcrypt, excluding the wait for a worker.",
+    ("operation",),
+    buckets=(0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0),
+)
+
+throttle_rejections_total = registry.counter(
+    "throttle_rejections_total",
+    "Requests turned away before doing bcrypt work, by route and reason.",
+    ("route", "reason"),
+)
+
+
+def timed_pool_class(pool_class: Type[Pool], name: str) -> Type[Pool]:
+    """``pool_class`` with ``connect`` timed into ``db_pool_checkout_seconds``.
+
+    Pools have no "checkout started" event, so the wait is measured around
+    the public ``Pool.connect``. Pass the result as ``poolclass=``; the pool
+    keeps its class through ``engine.dispose()`` and ``Pool.recreate()``.
+    """
+
+    def connect(self: Pool) -> Any:
+        start = time.perf_counter()
+        try:
+            return pool_class.connect(self)
+        finally:
+            db_pool_checkout_seconds.observe(name, value=time.perf_counter() - start)
+
+    return type(f"Timed{pool_class.__name__}", (pool_class,), {"connect": connect})
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """Export pool counters for ``engine`` and refresh its gauges on scrape."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, record: Any) -> None:
+        db_pool_connects_total.inc(name)
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        db_pool_checkouts_total.inc(name)
+
+    def _collect() -> None:
+        pool = sync_engine.pool
+        for gauge, attr in (
+            (db_pool_size, "size"),
+            (db_pool_checked_out, "checkedout"),
+            (db_pool_checked_in, "checkedin"),
+            (db_pool_overflow, "overflow"),
+        ):
+            method = getattr(pool, attr, None)
+            if method is not None:
+                gauge.set(name, value=method())
+
+    registry.add_collector(_collect)
+
+
+def instrument_cache(cache: ICacheBackend, name: str) -> None:
+    """Export ``cache.stats()`` on scrape. The backend keeps running totals,
+    so the counters are advanced by the difference since the last scrape."""
+    seen = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _collect() -> None:
+        stats = cache.stats()
+        for key, counter, labels in (
+            ("hits", cache_lookups_total, (name, "hit")),
+            ("misses", cache_lookups_total, (name, "miss")),
+            ("evictions", cache_evictions_total, (name,)),
+        ):
+            counter.inc(*labels, amount=stats[key] - seen[key])
+            seen[key] = stats[key]
+        cache_entries.set(name, value=stats["size"])
+
+    registry.add_collector(_collect)
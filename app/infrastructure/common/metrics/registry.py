@@ -0,0 +1,251 @@
+import json
+import math
+import os
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Sequence[str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(value) for value in labels)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+
+    def set(self, *labels: str, value: float) -> None:
+        self.values[self._key(labels)] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket ..., count above the last bucket, sum]
+        self.values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        key = self._key(labels)
+        row = self.values.get(key)
+        if row is None:
+            row = self.values[key] = [0.0] * (len(self.buckets) + 2)
+        row[bisect_left(self.buckets, value)] += 1
+        row[-1] += value
+
+
+class MetricsRegistry:
+    """Plain-dict metrics owned by one worker process.
+
+    Updates are ordinary dict operations on the event loop thread, so there
+    are no locks on the hot path. With several workers, each one writes its
+    values to ``<multiprocess_dir>/<pid>.json`` and a scrape served by any
+    worker adds up all the files.
+    """
+
+    def __init__(self, multiprocess_dir: Optional[str] = None):
+        self.multiprocess_dir = multiprocess_dir
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets=buckets)
+        )
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` before every snapshot, e.g. to refresh gauges."""
+        self._collectors.append(collector)
+
+    # --- snapshots ---
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        for collector in self._collectors:
+            collector()
+        return {
+            name: {"values": [[list(k), v] for k, v in metric.values.items()]}
+            for name, metric in self._metrics.items()
+        }
+
+    def _snapshot_path(self, pid: Optional[int] = None) -> str:
+        return os.path.join(self.multiprocess_dir, f"{pid or os.getpid()}.json")
+
+    def write_snapshot(self, live: bool = True) -> None:
+        """Persist this worker's values. ``live=False`` drops its gauges, for
+        a worker that is shutting down."""
+        if not self.multiprocess_dir:
+            return
+        os.makedirs(self.multiprocess_dir, exist_ok=True)
+        data = self.snapshot()
+        if not live:
+            for name, metric in self._metrics.items():
+                if metric.kind == "gauge":
+                    data[name] = {"values": []}
+        path = self._snapshot_path()
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as fp:
+            json.dump(data, fp)
+        os.replace(tmp, path)
+
+    def _read_snapshots(self) -> Iterable[Dict[str, Dict[str, object]]]:
+        for entry in os.scandir(self.multiprocess_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path) as fp:
+                    yield json.load(fp)
+            except (OSError, ValueError):
+                continue
+
+    def collect(self) -> Dict[str, Dict[LabelValues, object]]:
+        """Values of every worker, added up per metric and label set."""
+        if not self.multiprocess_dir:
+            snapshots = [self.snapshot()]
+        else:
+            self.write_snapshot()
+            snapshots = list(self._read_snapshots())
+
+        merged: Dict[str, Dict[LabelValues, object]] = {
+            name: {} for name in self._metrics
+        }
+        for snapshot in snapshots:
+            for name, data in snapshot.items():
+                if name not in merged:
+                    continue
+                values = merged[name]
+                for labels, value in data["values"]:
+                    key = tuple(labels)
+                    if isinstance(value, list):
+                        current = values.get(key)
+                        values[key] = (
+                            list(value)
+                            if current is None
+                            else [a + b for a, b in zip(current, value)]
+                        )
+                    else:
+                        values[key] = values.get(key, 0.0) + value
+        return merged
+
+    # --- exposition ---
+    def render(self) -> str:
+        """Prometheus text exposition format, version 0.0.4."""
+        merged = self.collect()
+        lines: List[str] = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(merged[name].items()):
+                labels = list(zip(metric.labelnames, key))
+                if metric.kind == "histogram":
+                    lines.extend(_histogram_lines(name, metric.buckets, labels, value))
+                else:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(
+    name: str,
+    buckets: Sequence[float],
+    labels: List[Tuple[str, str]],
+    row: List[float],
+) -> List[str]:
+    lines = []
+    cumulative = 0.0
+    for bound, count in zip(buckets, row):
+        cumulative += count
+        bucket_labels = labels + [("le", _number(bound))]
+        lines.append(f"{name}_bucket{_labels(bucket_labels)} {_number(cumulative)}")
+    total = cumulative + row[len(buckets)]
+    lines.append(f"{name}_bucket{_labels(labels + [('le', '+Inf')])} {_number(total)}")
+    lines.append(f"{name}_sum{_labels(labels)} {_number(row[-1])}")
+    lines.append(f"{name}_count{_labels(labels)} {_number(total)}")
+    return lines
+
+
+def _labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+    return "{" + inner + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,194 @@
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.common.middlewares.conditional_get_middleware import (
+    encoded_etag,
+)
+from app.infrastructure.configs.app_config import app_settings
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+_NO_BODY_STATUSES = {204, 304}
+
+
+class _GzipStream:
+    def __init__(self) -> None:
+        # wbits=31: deflate with a gzip header and trailer.
+        self._compressor = zlib.compressobj(
+            app_settings.compression_gzip_level, zlib.DEFLATED, 31
+        )
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class _BrotliStream:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(
+            quality=app_settings.compression_brotli_quality
+        )
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._compressor.process(data)
+        return out + (self._compressor.finish() if final else self._compressor.flush())
+
+
+STREAMS = {"br": _BrotliStream, "gzip": _GzipStream}
+
+
+def _accepted_codings(accept_encoding: str) -> Dict[str, float]:
+    codings: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[name] = quality
+    return codings
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Best coding the client accepts: brotli when installed, then gzip."""
+    codings = _accepted_codings(accept_encoding)
+    wildcard = codings.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for name in ("br", "gzip") if brotli is not None else ("gzip",):
+        quality = codings.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Compresses response bodies with brotli or gzip, as the request's
+    ``Accept-Encoding`` allows.
+
+    Installed outermost, so it encodes the bytes the envelope produced.
+    Bodies under ``minimum_size``, bodies that are already encoded and
+    content types outside the allowlist are sent as they are. Streamed
+    bodies are flushed per chunk, so clients still get each chunk as soon as
+    it is produced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        content_types: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self.minimum_size = (
+            app_settings.compression_minimum_size
+            if minimum_size is None
+            else minimum_size
+        )
+        # Entries ending in "/" match every subtype, e.g. "text/".
+        self.content_types = tuple(
+            content_types or app_settings.compression_content_types
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        stream = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, stream
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None:
+                if stream is not None and message["type"] == "http.response.body":
+                    more_body = message.get("more_body", False)
+                    message = {
+                        **message,
+                        "body": stream.compress(
+                            message.get("body", b""), not more_body
+                        ),
+                    }
+                await send(message)
+                return
+
+            held, start = start, None
+            headers = MutableHeaders(scope=held)
+            if held["status"] == 304:
+                self._match_encoded_etag(headers, request_headers, encoding)
+            if message["type"] != "http.response.body" or not self._compressible(
+                held, headers
+            ):
+                await send(held)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if not more_body and len(body) < self.minimum_size:
+                await send(held)
+                await send(message)
+                return
+
+            stream = STREAMS[encoding]()
+            body = stream.compress(body, not more_body)
+            headers["content-encoding"] = encoding
+            del headers["content-length"]
+            if not more_body:
+                headers["content-length"] = str(len(body))
+            etag = headers.get("etag")
+            if etag is not None:
+                headers["etag"] = encoded_etag(etag, encoding)
+            await send(held)
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compressible(self, start: Message, headers: MutableHeaders) -> bool:
+        if start["status"] in _NO_BODY_STATUSES or "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0].strip()
+        return any(
+            (
+                media_type.startswith(allowed)
+                if allowed.endswith("/")
+                else media_type == allowed
+            )
+            for allowed in self.content_types
+        )
+
+    @staticmethod
+    def _match_encoded_etag(
+        headers: MutableHeaders, request_headers: Headers, encoding: str
+    ) -> None:
+        # A 304 carries the tag of the representation the client holds, which
+        # is the encoded one when it sent that tag back.
+        etag = headers.get("etag")
+        if etag is None:
+            return
+        tagged = encoded_etag(etag, encoding)
+        if tagged in request_headers.get("if-none-match", ""):
+            headers["etag"] = tagged
@@ -0,0 +1,104 @@
+import hashlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Appended by CompressionMiddleware to strong ETags set by a route, so that
+# every content coding of the response has its own strong validator.
+ENCODING_SUFFIXES = ("-gzip", "-br")
+
+_NOT_MODIFIED_DROPPED_HEADERS = ("content-length", "content-type")
+
+
+def make_etag(body: bytes) -> str:
+    """Weak tag over ``body``: the bytes sent also carry the envelope's
+    ``duration``, so they are not byte-for-byte stable."""
+    return 'W/"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """``"abc"`` -> ``"abc-gzip"``. Weak tags are returned unchanged."""
+    if not etag.startswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(f'{suffix}"'):
+            return tag[: -len(suffix) - 1] + '"'
+    return tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as ``If-None-Match`` requires, ignoring the content
+    coding suffix."""
+    if if_none_match.strip() == "*":
+        return True
+    etag = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == etag for tag in if_none_match.split(","))
+
+
+class ConditionalGetMiddleware:
+    """Tags complete ``200`` responses to GET with a weak ``ETag`` and
+    answers a matching ``If-None-Match`` with ``304 Not Modified``.
+
+    Installed inside ResponseInterceptorMiddleware: the tag is computed over
+    the payload the envelope wraps, not over the bytes sent, which add the
+    ``duration`` (and the SQL stats in debug), hence weak. The envelope
+    passes the 304 through untouched. Routes that set their own ``ETag``
+    keep it. Streamed bodies are not tagged.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            held, start = start, None
+            if message["type"] != "http.response.body" or message.get(
+                "more_body", False
+            ):
+                await send(held)
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=held)
+            etag = headers.get("etag")
+            if etag is None:
+                etag = make_etag(message.get("body", b""))
+                headers["etag"] = etag
+            if if_none_match and etag_matches(if_none_match, etag):
+                await send(self._not_modified(held))
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(held)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _not_modified(start: Message) -> Message:
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        for name in _NOT_MODIFIED_DROPPED_HEADERS:
+            del headers[name]
+        return {**start, "status": 304, "headers": headers.raw}
@@ -1,49 +1,96 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 from typing import List, Optional
 
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.common.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.common.middlewares.path_matcher import PathMatcher
+from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.services.token_revocation_service import (
+    TokenDenylist,
+    token_denylist,
+)
 from infrastructure.common.exceptions.http_exceptions import UnauthorizedException
 from infrastructure.services.jwt_service import JWTService
 
+DEFAULT_EXCLUDED_PATHS = [
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/metrics",
+    "/",
+    "/api/v1/health",
+    "/api/v1/auth/login",
+    "/api/v1/auth/register",
+    "/api/v1/auth/refresh-token",
+]
+
+
+class JWTMiddleware:
+    """Pure ASGI access-token check.
+
+    Verified payloads are cached per token until the token's own ``exp``, so a
+    client reusing its access token skips the signature check. Revocation is
+    checked on every request, cached or not, against the per-worker denylist,
+    which only does I/O for Bloom filter hits. Paths ending in
+    ``*`` in ``excluded_paths`` are matched as prefixes.
+    """
 
-class JWTMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         jwt_service: Optional[JWTService] = None,
         excluded_paths: Optional[List[str]] = None,
+        cache_size: Optional[int] = None,
+        denylist: Optional[TokenDenylist] = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.jwt_service = jwt_service or JWTService()
-        self.excluded_paths = excluded_paths or [
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/",
-            "/api/v1/health",
-            "/api/v1/auth/login",
-            "/api/v1/auth/register",
-            "/api/v1/auth/refresh-token",
-        ]
-
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
-
-        token = self.extract_token(request.headers.get("Authorization"))
-        if not token:
-            raise UnauthorizedException("Missing token")
-
-        payload = self.jwt_service.verify_access_token(token)
-
-        request.state.user = payload.get("user")
-        if not request.state.user:
+        self.denylist = denylist or token_denylist
+        self.excluded_paths = PathMatcher(excluded_paths or DEFAULT_EXCLUDED_PATHS)
+        self.token_cache = TTLLRUCache(
+            max_size=(
+                app_settings.jwt_verified_cache_size
+                if cache_size is None
+                else cache_size
+            )
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.excluded_paths.matches(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        token = self.extract_token(self._get_authorization_header(scope))
+        payload = self.verify_token(token)
+        jti = payload.get("jti")
+        if jti is not None and await self.denylist.is_revoked(jti, payload.get("exp")):
+            raise UnauthorizedException("access token revoked")
+
+        user = payload.get("user")
+        if not user:
             raise UnauthorizedException("Invalid token payload")
+        state = scope.setdefault("state", {})
+        state["user"] = dict(user)
+        state["token"] = payload
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
-    def extract_token(self, auth_header: str) -> str:
+    def verify_token(self, token: str) -> dict:
+        payload = self.token_cache.get(token)
+        if payload is None:
+            payload = self.jwt_service.verify_access_token(token)
+            if payload.get("exp") is not None:
+                self.token_cache.set(token, payload, expires_at=payload["exp"])
+        return payload
+
+    def extract_token(self, auth_header: Optional[str]) -> str:
         if not auth_header or not auth_header.startswith("Bearer "):
             raise UnauthorizedException("Invalid or missing Authorization header")
         return auth_header.split(" ")[1]
+
+    @staticmethod
+    def _get_authorization_header(scope: Scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                return value.decode("latin-1")
+        return None
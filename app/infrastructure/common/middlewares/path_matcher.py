@@ -0,0 +1,28 @@
+import re
+from typing import Iterable
+
+
+class PathMatcher:
+    """Precompiled matcher for exact paths and ``/prefix/*`` patterns."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        exact = set()
+        prefixes = []
+        for pattern in patterns:
+            if pattern.endswith("*"):
+                prefixes.append(pattern[:-1])
+            else:
+                exact.add(pattern)
+        self._exact = frozenset(exact)
+        self._prefix_re = (
+            re.compile(
+                "|".join(re.escape(p) for p in sorted(prefixes, key=len, reverse=True))
+            )
+            if prefixes
+            else None
+        )
+
+    def matches(self, path: str) -> bool:
+        if path in self._exact:
+            return True
+        return self._prefix_re is not None and self._prefix_re.match(path) is not None
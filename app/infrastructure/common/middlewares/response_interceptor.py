@@ -1,105 +1,282 @@
 import json
 import time
 import logging
-import traceback
-from fastapi import Request
+from typing import List, Optional
+
 from fastapi.exceptions import HTTPException, RequestValidationError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.common.middlewares.path_matcher import PathMatcher
+from app.infrastructure.common.profiling.sql_profiler import current_stats
+from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.configs.logging_config import sample_success
 
 
 logger = logging.getLogger("app.middleware")
 
+# Routes set this response header to change how their body is wrapped:
+# "skip" sends the response untouched, "stream" wraps a streaming body
+# chunk by chunk. Streaming bodies are otherwise sent untouched.
+ENVELOPE_HEADER = "x-envelope"
+ENVELOPE_SKIP = "skip"
+ENVELOPE_STREAM = "stream"
+
+DEFAULT_EXCLUDED_PATHS = [
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/metrics",
+]
+
+_NO_BODY_STATUSES = {204, 304}
+
+
+def _duration_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
+
+
+def _log_fields(scope: Scope, status: int, duration: int) -> dict:
+    route = scope.get("route")
+    return {
+        "method": scope["method"],
+        "path": scope["path"],
+        "route": getattr(route, "path", None),
+        "status": status,
+        "duration_ms": duration,
+    }
+
+
+def _sql_fields() -> dict:
+    # Debug-only: queries the request has issued so far (see SqlProfilerMiddleware).
+    stats = current_stats()
+    if stats is None:
+        return {}
+    return {"sql": {"queries": stats.count, "duration": f"{stats.duration_ms}ms"}}
+
+
+class _EnvelopeSender:
+    """Wraps already-encoded JSON bodies as
+    ``{"success":..,"status_code":..,"data":<body>,"duration":..}``
+    by writing a prefix and a suffix around them, without parsing or
+    re-encoding the payload.
+    """
+
+    def __init__(
+        self, scope: Scope, send: Send, start: float, skip: bool, debug: bool = False
+    ):
+        self.scope = scope
+        self.downstream = send
+        self.start = start
+        self.skip = skip
+        self.debug = debug
+        self.started = False
+        self.status_code = 200
+        self._start_message: Message = {}
+        self._streaming = False
+        self._is_json = True
+        self._has_data = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._on_start(message)
+            if self.skip:
+                await self._send_start()
+            return
+
+        if message["type"] != "http.response.body" or self.skip:
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            if more_body and not self._streaming:
+                # Streaming responses are only enveloped when the route opts in.
+                self.skip = True
+                await self._send_start()
+                await self.downstream(message)
+                return
+            if not self._is_json and not self._streaming:
+                body = self._encode_text(body)
+            self._has_data = bool(body)
+            if not more_body:
+                body = self._prefix() + (body or b"{}") + self._suffix()
+                await self._send_start(content_length=len(body))
+                await self.downstream({"type": "http.response.body", "body": body})
+                self._log()
+                return
+            await self._send_start()
+            body = self._prefix() + body
+        else:
+            self._has_data = self._has_data or bool(body)
+            if not more_body:
+                body = (body if self._has_data else b"{}") + self._suffix()
+
+        await self.downstream(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+        if not more_body:
+            self._log()
+
+    def _on_start(self, message: Message) -> None:
+        headers = MutableHeaders(raw=list(message.get("headers", [])))
+        mode = headers.get(ENVELOPE_HEADER)
+        if mode is not None:
+            del headers[ENVELOPE_HEADER]
+        self.status_code = message["status"]
+        self.skip = (
+            self.skip
+            or mode == ENVELOPE_SKIP
+            or self.status_code in _NO_BODY_STATUSES
+            or self.scope["method"] == "HEAD"
+        )
+        self._streaming = mode == ENVELOPE_STREAM
+        self._is_json = headers.get("content-type", "").startswith("application/json")
+        self._start_message = {**message, "headers": headers.raw}
+
+    async def _send_start(self, content_length: Optional[int] = None) -> None:
+        self.started = True
+        if self.skip:
+            await self.downstream(self._start_message)
+            return
+        headers = MutableHeaders(raw=self._start_message["headers"])
+        del headers["content-length"]
+        headers["content-type"] = "application/json"
+        if content_length is not None:
+            headers["content-length"] = str(content_length)
+        await self.downstream(
+            {
+                "type": "http.response.start",
+                "status": self._public_status(),
+                "headers": headers.raw,
+            }
+        )
+
+    def _public_status(self) -> int:
+        return 400 if self.status_code == 422 else self.status_code
+
+    @staticmethod
+    def _encode_text(body: bytes) -> bytes:
+        if not body:
+            return body
+        text = body.decode("utf-8", errors="replace")
+        payload = {"message": text}
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def _prefix(self) -> bytes:
+        success = b"true" if self.status_code < 400 else b"false"
+        return b'{"success":%s,"status_code":%d,"data":' % (
+            success,
+            self._public_status(),
+        )
+
+    def _suffix(self) -> bytes:
+        suffix = b',"duration":"%dms"' % _duration_ms(self.start)
+        if self.debug:
+            for key, value in _sql_fields().items():
+                suffix += b',"%s":%s' % (
+                    key.encode(),
+                    json.dumps(value, separators=(",", ":")).encode(),
+                )
+        return suffix + b"}"
+
+    def _log(self) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        if self.status_code < 400 and not sample_success():
+            return
+        duration = _duration_ms(self.start)
+        logger.info(
+            "%s %s completed_in=%dms status=%d",
+            self.scope["method"],
+            self.scope["path"],
+            duration,
+            self.status_code,
+            extra=_log_fields(self.scope, self.status_code, duration),
+        )
+
+
+class ResponseInterceptorMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        excluded_paths: Optional[List[str]] = None,
+        debug: Optional[bool] = None,
+    ):
+        self.app = app
+        self.excluded_paths = PathMatcher(excluded_paths or DEFAULT_EXCLUDED_PATHS)
+        self.debug = app_settings.app_debug if debug is None else debug
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class ResponseInterceptorMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         start = time.perf_counter()
+        sender = _EnvelopeSender(
+            scope,
+            send,
+            start,
+            skip=self.excluded_paths.matches(scope["path"]),
+            debug=self.debug,
+        )
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, sender.send)
         except HTTPException as exc:
-            duration = int((time.perf_counter() - start) * 1000)
-            return JSONResponse(
+            if sender.started:
+                raise
+            response = JSONResponse(
                 {
                     "success": False,
                     "status_code": exc.status_code,
                     "error": exc.detail,
-                    "duration": f"{duration}ms",
+                    "duration": f"{_duration_ms(start)}ms",
+                    **(_sql_fields() if self.debug else {}),
                 },
                 status_code=exc.status_code,
+                headers=exc.headers,
             )
+            await response(scope, receive, send)
         except RequestValidationError as exc:
-            duration = int((time.perf_counter() - start) * 1000)
-            return JSONResponse(
+            if sender.started:
+                raise
+            response = JSONResponse(
                 {
                     "success": False,
                     "status_code": 400,
                     "error": exc.errors(),
-                    "duration": f"{duration}ms",
+                    "duration": f"{_duration_ms(start)}ms",
+                    **(_sql_fields() if self.debug else {}),
                 },
                 status_code=400,
             )
+            await response(scope, receive, send)
         except Exception:
-            duration = int((time.perf_counter() - start) * 1000)
+            duration = _duration_ms(start)
             logger.error(
-                f"Unhandled server error in {request.method} {request.url} "
-                f"duration={duration}ms\n{traceback.format_exc()}"
+                "Unhandled server error in %s %s duration=%dms",
+                scope["method"],
+                scope["path"],
+                duration,
+                exc_info=True,
+                extra=_log_fields(scope, 500, duration),
             )
-            return JSONResponse(
+            if sender.started:
+                raise
+            response = JSONResponse(
                 {
                     "success": False,
                     "status_code": 500,
                     "error": "Internal server error",
                     "duration": f"{duration}ms",
+                    **(_sql_fields() if self.debug else {}),
                 },
                 status_code=500,
             )
-
-        duration = int((time.perf_counter() - start) * 1000)
-
-        # Bỏ qua docs & streaming response
-        if isinstance(response, StreamingResponse) or request.url.path in [
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-        ]:
-            return response
-
-        # Xử lý JSON body
-        try:
-            body = [chunk async for chunk in response.body_iterator]
-            raw_body = b"".join(body)
-
-            try:
-                parsed_body = json.loads(raw_body.decode()) if raw_body else {}
-            except json.JSONDecodeError:
-                parsed_body = {"message": raw_body.decode()}
-
-            new_response = JSONResponse(
-                {
-                    "success": response.status_code < 400,
-                    "status_code": (
-                        400 if response.status_code == 422 else response.status_code
-                    ),
-                    "data": parsed_body,
-                    "duration": f"{duration}ms",
-                },
-                status_code=(
-                    400 if response.status_code == 422 else response.status_code
-                ),
-            )
-
-            # Copy headers (trừ content-length)
-            for k, v in response.headers.items():
-                if k.lower() != "content-length":
-                    new_response.headers[k] = v
-
-            logger.info(
-                f"{request.method} {request.url.path} "
-                f"completed_in={duration}ms status={response.status_code}"
-            )
-            return new_response
-
-        except Exception as e:
-            logger.error(f"Response interceptor error: {e}")
-            return response
+            await response(scope, receive, send)
@@ -0,0 +1,67 @@
+import logging
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.common.profiling.sql_profiler import (
+    SqlStats,
+    current_stats,
+    end_request,
+    start_request,
+)
+from app.infrastructure.configs.app_config import app_settings
+
+logger = logging.getLogger("app.sql")
+
+
+def server_timing(stats: SqlStats) -> str:
+    return f'db;dur={stats.duration_ms};desc="{stats.count} queries"'
+
+
+class SqlProfilerMiddleware:
+    """Counts the queries of each request and how long they took.
+
+    The totals go out as a ``Server-Timing: db;...`` header, and a warning is
+    logged when one statement shape repeats more than
+    ``sql_repeat_warning_threshold`` times in a request, the usual sign of an
+    N+1 access pattern.
+
+    Only installed with ``app_debug``: the header exposes internal database
+    timing to every client.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: Optional[int] = None):
+        self.app = app
+        self.repeat_threshold = (
+            app_settings.sql_repeat_warning_threshold
+            if repeat_threshold is None
+            else repeat_threshold
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request()
+        stats = current_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request(token)
+            for statement, times in stats.repeated(self.repeat_threshold):
+                logger.warning(
+                    "Possible N+1: %s %s ran the same statement %d times: %s",
+                    scope["method"],
+                    scope["path"],
+                    times,
+                    " ".join(statement.split())[:200],
+                )
@@ -0,0 +1,73 @@
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_START_KEY = "sql_profiler_start"
+
+
+class SqlStats:
+    """Queries issued while serving one request."""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        # Statements are parameterized, so the SQL text is the query shape.
+        self.shapes: Counter = Counter()
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.seconds * 1000, 3)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes issued more than ``threshold`` times, most frequent first."""
+        return [(sql, n) for sql, n in self.shapes.most_common() if n > threshold]
+
+
+_current: ContextVar[Optional[SqlStats]] = ContextVar("sql_stats", default=None)
+
+
+def start_request() -> Token:
+    return _current.set(SqlStats())
+
+
+def end_request(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_stats() -> Optional[SqlStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    if _current.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    stats.count += 1
+    stats.seconds += time.perf_counter() - starts.pop()
+    stats.shapes[statement] += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attribute every query run on ``engine`` to the request being served.
+
+    The async engine runs its sync core in a greenlet that shares the
+    caller's context, so the request's context variable is visible here.
+    """
+    sync_engine: Any = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
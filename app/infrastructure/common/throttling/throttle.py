@@ -0,0 +1,84 @@
+import math
+from typing import Dict, Optional
+
+from app.infrastructure.common.exceptions.http_exceptions import (
+    ServiceUnavailableException,
+    TooManyRequestsException,
+)
+from app.infrastructure.common.metrics.app_metrics import throttle_rejections_total
+from app.infrastructure.common.throttling.token_bucket import (
+    InMemoryTokenBucketStore,
+    ITokenBucketStore,
+    RateLimit,
+)
+from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.services.hash_service import HashWorkerPool, hash_worker_pool
+
+# Route -> {"ip" | "email": budget}
+Budgets = Dict[str, Dict[str, RateLimit]]
+
+
+def _budgets(**per_minute: int) -> Dict[str, RateLimit]:
+    # A budget of 0 means no limit for that scope.
+    return {scope: RateLimit(n) for scope, n in per_minute.items() if n > 0}
+
+
+def default_budgets() -> Budgets:
+    return {
+        "login": _budgets(
+            ip=app_settings.throttle_login_ip_per_minute,
+            email=app_settings.throttle_login_email_per_minute,
+        ),
+        "register": _budgets(
+            ip=app_settings.throttle_register_ip_per_minute,
+            email=app_settings.throttle_register_email_per_minute,
+        ),
+    }
+
+
+class Throttle:
+    """Admission control for routes that run bcrypt.
+
+    A request is turned away with a 503 while this worker's bcrypt pool is
+    full, and with a 429 once the client IP or the target email has used up
+    the route's budget. Both checks run before any database or bcrypt work.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ITokenBucketStore] = None,
+        budgets: Optional[Budgets] = None,
+        pool: Optional[HashWorkerPool] = None,
+    ) -> None:
+        self.store = store or InMemoryTokenBucketStore(app_settings.throttle_max_keys)
+        self.budgets = default_budgets() if budgets is None else budgets
+        for route, limits in self.budgets.items():
+            for scope, limit in limits.items():
+                if limit.per_minute <= 0:
+                    raise ValueError(
+                        f"{route} {scope} budget must be positive, "
+                        f"got {limit.per_minute}"
+                    )
+        self.pool = pool or hash_worker_pool
+
+    async def check(
+        self, route: str, ip: Optional[str], email: Optional[str] = None
+    ) -> None:
+        if self.pool.pending >= self.pool.max_pending:
+            throttle_rejections_total.inc(route, "busy")
+            raise ServiceUnavailableException("Server is busy, please retry later")
+        budgets = self.budgets.get(route, {})
+        for scope, key in (("ip", ip), ("email", email)):
+            limit = budgets.get(scope)
+            if limit is None or not key:
+                continue
+            wait = await self.store.take(f"{route}:{scope}:{key}", limit)
+            if wait > 0:
+                throttle_rejections_total.inc(route, scope)
+                raise TooManyRequestsException(
+                    "Too many attempts, please retry later",
+                    retry_after=math.ceil(wait),
+                )
+
+
+throttle = Throttle()
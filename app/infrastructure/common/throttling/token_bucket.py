@@ -0,0 +1,66 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, NamedTuple
+
+from app.infrastructure.common.cache.ttl_lru_cache import TTLLRUCache
+
+
+class RateLimit(NamedTuple):
+    """``per_minute`` requests on average, in bursts of up to ``per_minute``.
+
+    ``per_minute`` must be positive; leave a scope out of the budgets to not
+    limit it.
+    """
+
+    per_minute: int
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+    @property
+    def capacity(self) -> float:
+        return float(self.per_minute)
+
+
+class ITokenBucketStore(ABC):
+    """Token buckets by key.
+
+    Async so that a store shared by several workers can sit behind it; taking
+    from a bucket has to be atomic in such a store.
+    """
+
+    @abstractmethod
+    async def take(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        """Take ``cost`` tokens from ``key``'s bucket.
+
+        Returns 0 when they were taken, otherwise the seconds until the bucket
+        holds enough tokens; nothing is taken in that case.
+        """
+
+
+class InMemoryTokenBucketStore(ITokenBucketStore):
+    """Per-process buckets, dropped once refilled or when ``max_keys`` is
+    exceeded (least recently used first)."""
+
+    def __init__(
+        self, max_keys: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.clock = clock
+        self._buckets = TTLLRUCache(max_size=max_keys, clock=clock)
+
+    async def take(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        now = self.clock()
+        rate, capacity = limit.rate, limit.capacity
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+        wait = 0.0
+        if tokens < cost:
+            wait = (cost - tokens) / rate
+        else:
+            tokens -= cost
+        # A full bucket is the same as no bucket, so let it expire then.
+        self._buckets.set(
+            key, (tokens, now), expires_at=now + (capacity - tokens) / rate
+        )
+        return wait
@@ -1,5 +1,6 @@
+from pydantic import NonNegativeInt
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -7,6 +8,9 @@ class Settings(BaseSettings):
     app_environment: str = "development"
     app_url: str = "http://localhost:8000"
     app_name: str = "Clean Architecture FastAPI Template"
+    # Profiles the SQL of each request: stats in the response envelope, a
+    # Server-Timing header and N+1 warnings. Never enable in production.
+    app_debug: bool = False
     api_key: str = "default-api-key"
 
     # JWT settings
@@ -14,14 +18,88 @@ class Settings(BaseSettings):
     jwt_refresh_secret: str = "default-refresh-secret"
     jwt_access_expires_seconds: int = 3600
     jwt_refresh_expires_seconds: int = 604800
+    jwt_verified_cache_size: int = 10000
+    jwt_codec: str = "hs256"  # "hs256" (hmac-based) or "jose"
+
+    # Access token revocation settings
+    token_denylist_capacity: int = 100000  # revocations alive at once
+    token_denylist_error_rate: float = 0.001  # share of checks that hit the DB
+    token_denylist_sync_seconds: float = 30.0
+    token_denylist_prune_seconds: float = 3600.0
+
+    # Password hashing settings
+    hash_executor: str = "thread"  # "thread" or "process"
+    hash_max_workers: int = 4
+    hash_max_pending: int = 64
+
+    # Throttling of the bcrypt endpoints (login, register); a budget of 0
+    # turns that limit off
+    throttle_enabled: bool = True
+    throttle_login_ip_per_minute: NonNegativeInt = 30
+    throttle_login_email_per_minute: NonNegativeInt = 5
+    throttle_register_ip_per_minute: NonNegativeInt = 10
+    throttle_register_email_per_minute: NonNegativeInt = 3
+    throttle_max_keys: int = 100000  # buckets kept per worker
+
+    # Refresh token storage settings
+    refresh_token_digest_mode: str = "hmac"  # "hmac" or "bcrypt"
+    refresh_token_digest_secret: str = ""  # derived from jwt_refresh_secret if empty
 
     # Database settings
+    database_driver: str = "mysql"  # "mysql", "postgresql" or "sqlite"
+    database_url: str = ""  # overrides driver and the parts below when set
     database_name: str = "aicademy_db"
     database_user: str = "admin"
     database_password: str = "password"
     database_host: str = "localhost"
-    database_port: int = 3306
+    database_port: Optional[int] = None  # the backend's default port when unset
     database_schema: str = "public"
+    bulk_batch_size: int = 1000
+    statement_cache_size: int = 256  # cached filter statement shapes
+    # Store primary keys as 16-byte UUIDs (BINARY(16), uuid on PostgreSQL)
+    # instead of CHAR(36) strings; see the 20261018_130000 migration.
+    database_binary_uuid: bool = False
+    database_replica_urls: List[str] = []  # read replicas, same backend as primary
+    database_replica_strategy: str = "round_robin"  # or "least_connections"
+    database_echo: bool = False
+    database_pool_size: int = 10
+    database_max_overflow: int = 20
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 3600
+    database_pool_pre_ping: bool = True
+    database_pool_warmup: int = 5  # connections opened at startup, per engine
+
+    # Repository cache settings
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: int = 60
+    user_cache_max_entries: int = 10000
+
+    # Metrics settings
+    metrics_enabled: bool = True
+    # Shared directory for per-worker snapshots when running several workers
+    metrics_multiprocess_dir: str = ""
+    metrics_flush_seconds: float = 5.0
+
+    # SQL profiling settings (only with app_debug)
+    sql_repeat_warning_threshold: int = 5  # same statement per request
+
+    # Logging settings
+    log_level: str = "INFO"
+    log_format: str = "json"  # "json" or "text"
+    log_success_sample_rate: float = 1.0  # share of 2xx/3xx requests logged
+
+    # Response compression and conditional GET settings
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024  # bytes; smaller bodies are sent as is
+    compression_content_types: List[str] = [
+        "application/json",
+        "application/javascript",
+        "image/svg+xml",
+        "text/",
+    ]
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4  # used when the brotli package is installed
+    etag_enabled: bool = True
 
     # CORS settings
     cors_origins: List[str] = ["*"]
@@ -34,6 +112,16 @@ class Settings(BaseSettings):
     server_port: int = 8000
     server_reload: bool = True
     server_log_level: str = "info"
+    # Production server (APP_ENVIRONMENT=production), see app/launcher.py
+    server_workers: int = 0  # 0 = one per CPU
+    server_loop: str = "auto"  # "auto" uses uvloop when installed
+    server_http: str = "auto"  # "auto" uses httptools when installed
+    server_preload: bool = False  # import the app once before forking workers
+    server_max_requests: int = 0  # recycle a worker after this many; 0 = never
+    server_max_requests_jitter: int = 0  # spreads out recycling across workers
+    server_keep_alive_seconds: int = 5
+    server_backlog: int = 2048
+    server_graceful_timeout: int = 30
 
     class Config:
         env_file = ".env"
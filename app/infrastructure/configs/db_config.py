@@ -1,54 +1,196 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+from app.infrastructure.common.metrics.app_metrics import timed_pool_class
 from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.configs.routing_session import ReplicaSet, RoutingSession
+
+logger = logging.getLogger("app.database")
+
+# --- Drivers per backend: (sync, async) ---
+DRIVERS = {
+    "mysql": ("mysql+pymysql", "mysql+aiomysql"),
+    "postgresql": ("postgresql+psycopg2", "postgresql+asyncpg"),
+    "sqlite": ("sqlite", "sqlite+aiosqlite"),
+}
+
+# Used when DATABASE_PORT is not set.
+DEFAULT_PORTS = {"mysql": 3306, "postgresql": 5432}
+
+
+def _drivername(backend: str, is_async: bool) -> str:
+    if backend not in DRIVERS:
+        raise ValueError(f"Unsupported database backend: {backend}")
+    return DRIVERS[backend][1 if is_async else 0]
+
+
+def with_driver(url: str, is_async: bool = True) -> URL:
+    """``url`` with its driver swapped for the sync or async one of its backend."""
+    parsed = make_url(url)
+    return parsed.set(drivername=_drivername(parsed.get_backend_name(), is_async))
+
+
+def build_database_url(is_async: bool = True) -> URL:
+    """URL for the configured database.
+
+    ``DATABASE_URL`` wins when set; its driver is swapped for the sync or async
+    one of the same backend. Otherwise the URL is assembled from
+    ``DATABASE_DRIVER`` and the ``DATABASE_*`` parts; for SQLite,
+    ``DATABASE_NAME`` is the file path (or ``:memory:``).
+    """
+    if app_settings.database_url:
+        return with_driver(app_settings.database_url, is_async)
+    backend = app_settings.database_driver
+    drivername = _drivername(backend, is_async)
+    if backend == "sqlite":
+        return URL.create(drivername, database=app_settings.database_name)
+    return URL.create(
+        drivername,
+        username=app_settings.database_user,
+        password=app_settings.database_password,
+        host=app_settings.database_host,
+        port=app_settings.database_port or DEFAULT_PORTS[backend],
+        database=app_settings.database_name,
+    )
+
+
+def engine_kwargs(url: URL, name: Optional[str] = None) -> Dict[str, Any]:
+    """Engine options for ``url``. ``name`` labels the pool metrics of a
+    runtime engine."""
+    kwargs: Dict[str, Any] = {"echo": app_settings.database_echo}
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # Every connection to :memory: is a new database; share one.
+            kwargs["poolclass"] = StaticPool
+            kwargs["connect_args"] = {"check_same_thread": False}
+        return kwargs
+    kwargs.update(
+        pool_size=app_settings.database_pool_size,
+        max_overflow=app_settings.database_max_overflow,
+        pool_timeout=app_settings.database_pool_timeout,
+        pool_recycle=app_settings.database_pool_recycle,
+        pool_pre_ping=app_settings.database_pool_pre_ping,
+    )
+    if name is not None and app_settings.metrics_enabled:
+        kwargs["poolclass"] = timed_pool_class(AsyncAdaptedQueuePool, name)
+    return kwargs
+
 
 # --- Database URLs ---
-SYNC_DATABASE_URL = (
-    f"mysql+pymysql://{app_settings.database_user}:{app_settings.database_password}"
-    f"@{app_settings.database_host}:{app_settings.database_port}/"
-    f"{app_settings.database_name}"
+SYNC_DATABASE_URL = build_database_url(is_async=False).render_as_string(
+    hide_password=False
 )
-
-ASYNC_DATABASE_URL = (
-    f"mysql+aiomysql://{app_settings.database_user}:{app_settings.database_password}"
-    f"@{app_settings.database_host}:{app_settings.database_port}/"
-    f"{app_settings.database_name}"
+ASYNC_DATABASE_URL = build_database_url(is_async=True).render_as_string(
+    hide_password=False
 )
 
-# --- Sync engine (for Alembic and scripts) ---
-sync_engine = create_engine(
-    SYNC_DATABASE_URL,
-    echo=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+
+# --- Engines, created on first use ---
+@lru_cache
+def get_sync_engine() -> Engine:
+    """Engine for Alembic and scripts."""
+    return create_engine(
+        SYNC_DATABASE_URL, **engine_kwargs(make_url(SYNC_DATABASE_URL))
+    )
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Primary engine for the FastAPI runtime."""
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        **engine_kwargs(make_url(ASYNC_DATABASE_URL), "primary"),
+    )
+
+
+@lru_cache
+def get_replica_engines() -> List[AsyncEngine]:
+    """Optional read replicas; plain reads are routed away from the primary."""
+    return [
+        create_async_engine(url, **engine_kwargs(url, f"replica{i}"))
+        for i, url in enumerate(
+            with_driver(u) for u in app_settings.database_replica_urls
+        )
+    ]
+
 
 SyncSessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=sync_engine,
-)
-
-# --- Async engine (for FastAPI runtime) ---
-async_engine = create_async_engine(
-    ASYNC_DATABASE_URL,
-    echo=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,
 )
 
 AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    primary=lambda: get_async_engine().sync_engine,
+    replicas=ReplicaSet(
+        lambda: [engine.sync_engine for engine in get_replica_engines()],
+        strategy=app_settings.database_replica_strategy,
+    ),
     expire_on_commit=False,
     autoflush=False,
 )
 
+
+# --- Lifecycle ---
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections at once and return them to
+    the pool, so the first requests do not pay for connection setup."""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+    # Overflow connections are closed on return, so stop at the pool size.
+    connections = min(connections, pool.size())
+    opened = [engine.connect() for _ in range(connections)]
+    try:
+        await asyncio.gather(*(conn.start() for conn in opened))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in opened))
+    return connections
+
+
+async def warm_up_engines(connections: int) -> None:
+    for engine in [get_async_engine(), *get_replica_engines()]:
+        try:
+            opened = await warm_up_pool(engine, connections)
+        except Exception:
+            logger.warning(
+                "Pool warm-up failed for %s",
+                engine.url.render_as_string(hide_password=True),
+                exc_info=True,
+            )
+        else:
+            logger.info(
+                "Warmed up %d connections for %s",
+                opened,
+                engine.url.render_as_string(hide_password=True),
+            )
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections of every engine created so far. Connections
+    still checked out are closed when they are returned."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_replica_engines.cache_info().currsize:
+        for engine in get_replica_engines():
+            await engine.dispose()
+    if get_sync_engine.cache_info().currsize:
+        get_sync_engine().dispose()
+
+
 # --- Declarative base ---
 Base = declarative_base()
 
@@ -60,7 +202,7 @@ async def get_async_db():
 
 
 def get_sync_db():
-    db = SyncSessionLocal()
+    db = SyncSessionLocal(bind=get_sync_engine())
     try:
         yield db
     finally:
@@ -0,0 +1,99 @@
+import asyncio
+import contextlib
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from app.infrastructure.common.metrics import app_metrics
+from app.infrastructure.common.metrics.app_metrics import registry
+from app.infrastructure.common.profiling import sql_profiler
+from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.configs.logging_config import setup_logging, stop_logging
+from app.infrastructure.configs.db_config import (
+    dispose_engines,
+    get_async_engine,
+    get_replica_engines,
+    warm_up_engines,
+)
+from app.infrastructure.dependencies.repository_dependencies import (
+    get_user_cache_backend,
+)
+from app.infrastructure.services.hash_service import hash_worker_pool
+from app.infrastructure.services.token_revocation_service import token_denylist
+
+logger = logging.getLogger("app.auth")
+
+
+async def _flush_metrics(interval: float) -> None:
+    # Keeps this worker's numbers fresh for scrapes served by other workers.
+    while True:
+        await asyncio.sleep(interval)
+        registry.write_snapshot()
+
+
+async def _sync_denylist(interval: float, prune_interval: float) -> None:
+    # Picks up tokens revoked by other workers; pruning also rebuilds the
+    # filter so expired ids stop taking up space in it.
+    last_prune = time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if time.monotonic() - last_prune >= prune_interval:
+                await token_denylist.prune()
+                last_prune = time.monotonic()
+            else:
+                await token_denylist.sync()
+        except Exception:
+            logger.warning("Token denylist sync failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Installed here rather than in main so the request id filter and the
+    # middleware share one ``app.``-rooted logging_config module.
+    setup_logging()
+    flusher = None
+    engines = {"primary": get_async_engine()}
+    for i, engine in enumerate(get_replica_engines()):
+        engines[f"replica{i}"] = engine
+    for name, engine in engines.items():
+        if app_settings.metrics_enabled:
+            app_metrics.instrument_engine(engine, name)
+        if app_settings.app_debug:
+            sql_profiler.instrument_engine(engine)
+    user_cache = get_user_cache_backend()
+    if app_settings.metrics_enabled and user_cache is not None:
+        app_metrics.instrument_cache(user_cache, "users")
+    if app_settings.metrics_enabled and registry.multiprocess_dir:
+        flusher = asyncio.create_task(
+            _flush_metrics(app_settings.metrics_flush_seconds)
+        )
+    # Startup: fill the connection pools before the first request arrives.
+    if app_settings.database_pool_warmup > 0:
+        await warm_up_engines(app_settings.database_pool_warmup)
+    try:
+        await token_denylist.sync(full=True)
+    except Exception:
+        logger.warning("Token denylist could not be loaded", exc_info=True)
+    denylist_sync = asyncio.create_task(
+        _sync_denylist(
+            app_settings.token_denylist_sync_seconds,
+            app_settings.token_denylist_prune_seconds,
+        )
+    )
+    yield
+    # Shutdown: runs after the server has finished in-flight requests.
+    denylist_sync.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await denylist_sync
+    if flusher is not None:
+        flusher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flusher
+        registry.write_snapshot(live=False)
+    hash_worker_pool.shutdown(wait=True)
+    await dispose_engines()
+    stop_logging()
@@ -0,0 +1,117 @@
+import itertools
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Set in ``Session.info`` once a session has written (or is about to), so the
+# rest of its unit of work reads its own writes from the primary.
+PRIMARY_PIN_KEY = "pin_primary"
+
+# Execution option (or bind argument) that sends a single read to the primary
+# without pinning.
+USE_PRIMARY = "use_primary"
+
+# ``Session.info`` key of the replica a session reads from, chosen on its first
+# replica read.
+REPLICA_KEY = "replica"
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+
+def pin_primary(session: Any) -> None:
+    """Route every later statement of ``session`` to the primary."""
+    session.info[PRIMARY_PIN_KEY] = True
+
+
+def _checked_out(engine: Engine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout is not None else 0
+
+
+class ReplicaSet:
+    """Read replicas and the policy used to pick one per session.
+
+    ``engines`` may be a callable, resolved on first use, so replica engines
+    are only created once a session actually needs them.
+    """
+
+    def __init__(
+        self,
+        engines: Union[Sequence[Engine], Callable[[], Sequence[Engine]]],
+        strategy: str = "round_robin",
+    ):
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Unsupported replica strategy: {strategy}")
+        self._source = engines
+        self._engines: Optional[List[Engine]] = None
+        self.strategy = strategy
+        self._counter = itertools.count()
+
+    @property
+    def engines(self) -> List[Engine]:
+        if self._engines is None:
+            source = self._source
+            self._engines = list(source() if callable(source) else source)
+        return self._engines
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Engine:
+        if self.strategy == "least_connections":
+            return min(self.engines, key=_checked_out)
+        return self.engines[next(self._counter) % len(self.engines)]
+
+
+def _is_read(clause: Any) -> bool:
+    return (
+        clause is not None
+        and getattr(clause, "is_select", False)
+        and getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+class RoutingSession(Session):
+    """Sends plain SELECTs to a replica and everything else to the primary.
+
+    The replica is chosen once, on the session's first replica read, and kept
+    for its later reads: a request holds at most one replica connection and
+    all its reads see the same replication lag.
+
+    Flushes, DML, ``SELECT ... FOR UPDATE`` and raw SQL go to the primary and
+    pin the session there, as does ``pin_primary``. A request shares one
+    session through its unit of work, so this gives read-your-writes for the
+    rest of the request. Statements with the ``use_primary`` execution option
+    or bind argument read from the primary without pinning. Without replicas
+    this is a plain ``Session``.
+
+    ``primary`` supplies the engine when the session is created without a
+    ``bind``, which keeps engine creation out of import time.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        primary: Optional[Callable[[], Engine]] = None,
+        replicas: Optional[ReplicaSet] = None,
+        **kw: Any,
+    ):
+        if kw.get("bind") is None and primary is not None:
+            kw["bind"] = primary()
+        super().__init__(*args, **kw)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if not self.replicas or self.info.get(PRIMARY_PIN_KEY):
+            return primary
+        if self._flushing or not _is_read(clause):
+            pin_primary(self)
+            return primary
+        if kw.get(USE_PRIMARY) or clause.get_execution_options().get(USE_PRIMARY):
+            return primary
+        replica = self.info.get(REPLICA_KEY)
+        if replica is None:
+            replica = self.info[REPLICA_KEY] = self.replicas.choose()
+        return replica
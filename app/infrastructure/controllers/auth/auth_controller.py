@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.infrastructure.controllers.auth.dto.login_dto import LoginDto
+from app.infrastructure.dependencies.throttle_dependencies import throttled
 from app.infrastructure.dependencies.use_case_dependencies import get_auth_use_cases
 from app.usecases.auth.auth_use_cases import AuthUseCases
 from app.infrastructure.controllers.auth.dto.auth_response_dto import AuthResponseDto
@@ -11,7 +12,11 @@ from infrastructure.controllers.auth.dto.register_dto import RegisterDto
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/login", response_model=AuthResponseDto)
+@router.post(
+    "/login",
+    response_model=AuthResponseDto,
+    dependencies=[Depends(throttled("login"))],
+)
 async def login(
     body: LoginDto,
     res: Response,
@@ -22,7 +27,11 @@ async def login(
     return result["response"]
 
 
-@router.post("/register", response_model=AuthResponseDto)
+@router.post(
+    "/register",
+    response_model=AuthResponseDto,
+    dependencies=[Depends(throttled("register"))],
+)
 async def register(
     body: RegisterDto,
     res: Response,
@@ -48,7 +57,10 @@ async def refresh_token(
 @router.delete(
     "/logout",
     summary="Logout user",
-    description="Logout the currently authenticated user and invalidate refresh token",
+    description=(
+        "Logout the currently authenticated user, invalidate the refresh token "
+        "and revoke the access token"
+    ),
 )
 async def logout(
     res: Response,
@@ -56,7 +68,7 @@ async def logout(
     token: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
     auth_use_cases: AuthUseCases = Depends(get_auth_use_cases),
 ):
-    result = await auth_use_cases.logout(request.state.user["id"])
+    result = await auth_use_cases.logout(request.state.user["id"], request.state.token)
     res.set_cookie(**result["cookie"])
     return result["response"]
 
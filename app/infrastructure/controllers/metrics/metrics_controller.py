@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from app.infrastructure.common.metrics.app_metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
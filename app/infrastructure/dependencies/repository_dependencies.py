@@ -1,5 +1,35 @@
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import Depends
+
+from app.infrastructure.common.cache.cache_backend import (
+    ICacheBackend,
+    InMemoryCacheBackend,
+)
+from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.dependencies.unit_of_work_dependencies import (
+    get_unit_of_work,
+)
+from app.infrastructure.repositories.revoked_token_repository import (
+    RevokedTokenRepository,
+)
 from app.infrastructure.repositories.user_repository import UserRepository
 
 
-def get_user_repository():
-    return UserRepository()
+@lru_cache(maxsize=1)
+def get_user_cache_backend() -> Optional[ICacheBackend]:
+    if not app_settings.user_cache_enabled:
+        return None
+    return InMemoryCacheBackend(
+        max_entries=app_settings.user_cache_max_entries,
+        ttl_seconds=app_settings.user_cache_ttl_seconds,
+    )
+
+
+def get_user_repository(uow=Depends(get_unit_of_work)):
+    return UserRepository(uow.session, cache=get_user_cache_backend())
+
+
+def get_revoked_token_repository(uow=Depends(get_unit_of_work)):
+    return RevokedTokenRepository(uow.session)
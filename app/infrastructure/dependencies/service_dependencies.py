@@ -1,5 +1,14 @@
+from fastapi import Depends
+
+from app.infrastructure.dependencies.repository_dependencies import (
+    get_revoked_token_repository,
+)
 from app.infrastructure.services.hash_service import HashService
 from app.infrastructure.services.jwt_service import JWTService
+from app.infrastructure.services.token_digest_service import TokenDigestService
+from app.infrastructure.services.token_revocation_service import (
+    TokenRevocationService,
+)
 
 
 def get_hash_service():
@@ -8,3 +17,13 @@ def get_hash_service():
 
 def get_jwt_service():
     return JWTService()
+
+
+def get_token_digest_service(hash_service=Depends(get_hash_service)):
+    return TokenDigestService(hash_service)
+
+
+def get_token_revocation_service(
+    revoked_token_repository=Depends(get_revoked_token_repository),
+):
+    return TokenRevocationService(revoked_token_repository)
@@ -0,0 +1,29 @@
+import json
+
+from fastapi import Request
+
+from app.infrastructure.common.throttling.throttle import throttle
+from app.infrastructure.configs.app_config import app_settings
+
+
+def throttled(route: str):
+    """Route dependency applying ``route``'s budgets from ``Throttle``.
+
+    Route-level dependencies run before the endpoint's own, so a rejected
+    request never opens a session or reaches bcrypt.
+    """
+
+    async def dependency(request: Request) -> None:
+        if not app_settings.throttle_enabled:
+            return
+        email = None
+        try:
+            body = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            body = None
+        if isinstance(body, dict) and isinstance(body.get("email"), str):
+            email = body["email"].strip().lower()
+        ip = request.client.host if request.client else None
+        await throttle.check(route, ip, email)
+
+    return dependency
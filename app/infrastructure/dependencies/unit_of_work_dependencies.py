@@ -0,0 +1,6 @@
+from app.infrastructure.repositories.unit_of_work import SqlAlchemyUnitOfWork
+
+
+async def get_unit_of_work():
+    async with SqlAlchemyUnitOfWork() as uow:
+        yield uow
@@ -4,6 +4,8 @@ from app.infrastructure.dependencies.repository_dependencies import get_user_rep
 from app.infrastructure.dependencies.service_dependencies import (
     get_hash_service,
     get_jwt_service,
+    get_token_digest_service,
+    get_token_revocation_service,
 )
 from app.usecases.auth.auth_use_cases import AuthUseCases
 
@@ -12,5 +14,13 @@ def get_auth_use_cases(
     user_repository=Depends(get_user_repository),
     jwt_service=Depends(get_jwt_service),
     hash_service=Depends(get_hash_service),
+    token_digest_service=Depends(get_token_digest_service),
+    token_revocation_service=Depends(get_token_revocation_service),
 ):
-    return AuthUseCases(user_repository, jwt_service, hash_service)
+    return AuthUseCases(
+        user_repository,
+        jwt_service,
+        hash_service,
+        token_digest_service,
+        token_revocation_service,
+    )
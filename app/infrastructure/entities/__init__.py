@@ -1 +1,2 @@
 from .user_entity import UserEntity
+from .revoked_token_entity import RevokedTokenEntity
@@ -1,13 +1,13 @@
 from datetime import datetime
-import uuid
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, DateTime
 from app.infrastructure.configs.db_config import Base
+from app.infrastructure.entities.id_types import id_type, new_id
 
 
 class BaseEntity(Base):
     __abstract__ = True
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(id_type(), primary_key=True, default=new_id)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(
         DateTime,
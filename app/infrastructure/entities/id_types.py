@@ -0,0 +1,102 @@
+import secrets
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.types import BINARY, TypeDecorator, TypeEngine
+
+from app.infrastructure.configs.app_config import app_settings
+
+
+class UUID7Generator:
+    """Time-ordered UUIDs (RFC 9562 version 7).
+
+    48 bits of Unix milliseconds, then a 12-bit counter that keeps ids from
+    the same generator increasing within a millisecond, then 62 random bits.
+    ``clock_ms`` and ``randbits`` can be replaced for reproducible ids, as in
+    the seeds.
+    """
+
+    def __init__(
+        self,
+        clock_ms: Callable[[], int] = lambda: time.time_ns() // 1_000_000,
+        randbits: Callable[[int], int] = secrets.randbits,
+    ) -> None:
+        self._clock_ms = clock_ms
+        self._randbits = randbits
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def __call__(self) -> uuid.UUID:
+        with self._lock:
+            ms = self._clock_ms()
+            if ms > self._last_ms:
+                self._last_ms = ms
+                # Start low in the counter range to leave room for increments.
+                self._counter = self._randbits(11)
+            else:
+                self._counter += 1
+                if self._counter > 0xFFF:
+                    self._last_ms += 1
+                    self._counter = self._randbits(11)
+            ms, counter = self._last_ms, self._counter
+            rand = self._randbits(62)
+        return uuid.UUID(
+            int=(ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand
+        )
+
+
+uuid7 = UUID7Generator()
+
+
+def new_id() -> str:
+    return str(uuid7())
+
+
+class BinaryUUID(TypeDecorator):
+    """UUID stored in 16 bytes: ``BINARY(16)``, or ``uuid`` on PostgreSQL.
+
+    Entities, filters and DTOs keep dealing in the canonical 36-character
+    string; conversion happens only at the driver boundary.
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect) -> TypeEngine:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=False))
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[Any]:
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            raw = value.bytes
+        else:
+            # bytes.fromhex is several times cheaper than parsing a uuid.UUID.
+            try:
+                raw = bytes.fromhex(str(value).replace("-", ""))
+            except ValueError:
+                raw = b""
+            if len(raw) != 16:
+                # Not a UUID, so it matches no row; NULL compares false.
+                return None
+        if dialect.name == "postgresql":
+            return str(uuid.UUID(bytes=raw))
+        return raw
+
+    def process_result_value(self, value: Any, dialect) -> Optional[str]:
+        if value is None or dialect.name == "postgresql":
+            return value
+        h = bytes(value).hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def id_type() -> TypeEngine:
+    """Primary key column type, selected by ``database_binary_uuid``."""
+    return BinaryUUID() if app_settings.database_binary_uuid else String(36)
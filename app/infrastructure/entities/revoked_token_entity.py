@@ -0,0 +1,17 @@
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime
+from app.infrastructure.configs.db_config import Base
+
+
+class RevokedTokenEntity(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(36), primary_key=True)
+    user_id = Column(String(36), index=True, nullable=False)
+    expires_at = Column(
+        DateTime,
+        index=True,
+        nullable=False,
+        comment="exp of the revoked token; the row can be pruned after it",
+    )
+    created_at = Column(DateTime, index=True, default=datetime.utcnow, nullable=False)
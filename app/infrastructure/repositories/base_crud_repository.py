@@ -1,33 +1,82 @@
 import datetime
-from typing import Any, Dict, List, Optional, Callable, Type
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Callable,
+    Sequence,
+    Tuple,
+    Type,
+)
 from math import ceil
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import func, insert, inspect, select, delete, tuple_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import NoResultFound
 
+from app.infrastructure.configs.app_config import app_settings
 from app.infrastructure.configs.db_config import AsyncSessionLocal
+from app.infrastructure.configs.routing_session import USE_PRIMARY, pin_primary
+from app.infrastructure.repositories.keyset import (
+    NEXT,
+    PREV,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    seek_predicate,
+)
+from app.infrastructure.repositories.statement_cache import filter_statement
+
+DEFAULT_KEYSET_SORT: Sequence[SortKey] = (("created_at", "asc"), ("id", "asc"))
 
 
 class BaseCrudRepository:
 
     model: Type  # SQLAlchemy declarative model, set in subclass
 
-    def __init__(self, model: Type):
+    def __init__(self, model: Type, session: Optional[AsyncSession] = None):
         self.model = model
+        self.session = session
 
     # --- session handling ---
-    async def _get_session(
+    @asynccontextmanager
+    async def _session_scope(
+        self, session: Optional[AsyncSession] = None, for_write: bool = False
+    ) -> AsyncIterator[AsyncSession]:
+        async with self._transaction(session) as db:
+            if for_write:
+                # Reads made on the way to a write must not hit a lagging replica.
+                pin_primary(db)
+            yield db
+
+    @asynccontextmanager
+    async def _transaction(
         self, session: Optional[AsyncSession] = None
-    ) -> AsyncSession:
-        return session or AsyncSessionLocal()
+    ) -> AsyncIterator[AsyncSession]:
+        db = session or self.session
+        if db is None:
+            async with AsyncSessionLocal() as db, db.begin():
+                yield db
+        elif db.in_transaction():
+            # Owned by a unit of work, which commits or rolls back once.
+            yield db
+        else:
+            async with db.begin():
+                yield db
 
     # --- basic CRUD ---
     async def create(
         self, data: Dict[str, Any], session: Optional[AsyncSession] = None
     ) -> Any:
-        db = await self._get_session(session)
-        async with db.begin():
+        async with self._session_scope(session, for_write=True) as db:
             obj = self.model(**data)
             db.add(obj)
             await db.flush()
@@ -36,8 +85,7 @@ class BaseCrudRepository:
     async def update(
         self, id: Any, data: Dict[str, Any], session: Optional[AsyncSession] = None
     ) -> Any:
-        db = await self._get_session(session)
-        async with db.begin():
+        async with self._session_scope(session, for_write=True) as db:
             obj = await db.get(self.model, id)
             if not obj:
                 raise NoResultFound(f"{self.model.__name__} with id={id} not found")
@@ -46,11 +94,44 @@ class BaseCrudRepository:
             await db.flush()
             return obj
 
+    async def update_fields(
+        self,
+        id: Any,
+        data: Dict[str, Any],
+        *,
+        returning: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> Any:
+        """Change columns of one row with a single ``UPDATE ... WHERE pk=:id``.
+
+        Nothing is loaded first; Column.onupdate values such as ``updated_at``
+        are still applied by the UPDATE. The updated entity is only fetched
+        when ``returning`` is set (in the same statement where the dialect
+        supports UPDATE ... RETURNING), otherwise None is returned.
+        """
+        async with self._session_scope(session, for_write=True) as db:
+            pk = inspect(self.model).primary_key[0]
+            stmt = update(self.model).where(pk == id).values(**data)
+            if returning and db.get_bind().dialect.update_returning:
+                result = await db.execute(
+                    stmt.returning(self.model),
+                    execution_options={"populate_existing": True},
+                )
+                obj = result.scalars().first()
+                if obj is None:
+                    raise NoResultFound(f"{self.model.__name__} with id={id} not found")
+                return obj
+            result = await db.execute(stmt)
+            if result.rowcount == 0:
+                raise NoResultFound(f"{self.model.__name__} with id={id} not found")
+            if returning:
+                return await db.get(self.model, id, populate_existing=True)
+            return None
+
     async def upsert(
         self, data: Dict[str, Any], session: Optional[AsyncSession] = None
     ) -> Any:
-        db = await self._get_session(session)
-        async with db.begin():
+        async with self._session_scope(session, for_write=True) as db:
             obj = None
             if "id" in data:
                 obj = await db.get(self.model, data["id"])
@@ -64,8 +145,7 @@ class BaseCrudRepository:
             return obj
 
     async def delete(self, id: Any, session: Optional[AsyncSession] = None) -> None:
-        db = await self._get_session(session)
-        async with db.begin():
+        async with self._session_scope(session, for_write=True) as db:
             obj = await db.get(self.model, id)
             if not obj:
                 raise NoResultFound(f"{self.model.__name__} with id={id} not found")
@@ -74,21 +154,139 @@ class BaseCrudRepository:
     async def bulk_delete(
         self, ids: List[Any], session: Optional[AsyncSession] = None
     ) -> int:
-        db = await self._get_session(session)
-        async with db.begin():
+        async with self._session_scope(session, for_write=True) as db:
             stmt = delete(self.model).where(self.model.id.in_(ids))
             result = await db.execute(stmt)
             return result.rowcount
 
+    # --- bulk writes ---
+    async def bulk_create(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> int:
+        inserted = 0
+        async with self._session_scope(session, for_write=True) as db:
+            for batch in self._batches(rows, batch_size):
+                result = await db.execute(insert(self.model).values(batch))
+                inserted += result.rowcount
+        return inserted
+
+    async def bulk_upsert(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, int]:
+        """One multi-row upsert per batch, in the backend's own syntax:
+        ``INSERT ... ON DUPLICATE KEY UPDATE`` on MySQL/MariaDB and
+        ``INSERT ... ON CONFLICT DO UPDATE`` on PostgreSQL and SQLite.
+
+        ``conflict_cols`` must be covered by a unique key. Rows that already
+        exist are counted with one indexed lookup per batch, because MySQL's
+        affected-rows value cannot tell inserts from unchanged rows.
+        """
+        inserted = updated = 0
+        async with self._session_scope(session, for_write=True) as db:
+            dialect = db.get_bind().dialect.name
+            for batch in self._batches(rows, batch_size):
+                existing = await self._count_existing(db, batch, conflict_cols)
+                stmt = self._upsert_statement(
+                    dialect, batch, conflict_cols, update_cols
+                )
+                await db.execute(stmt)
+                updated += existing
+                inserted += len(batch) - existing
+        return {"inserted": inserted, "updated": updated}
+
+    def _batches(
+        self, rows: Iterable[Dict[str, Any]], batch_size: Optional[int]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        size = batch_size or app_settings.bulk_batch_size
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _count_existing(
+        self,
+        db: AsyncSession,
+        batch: List[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+    ) -> int:
+        columns = [getattr(self.model, name) for name in conflict_cols]
+        if len(columns) == 1:
+            condition = columns[0].in_({row[conflict_cols[0]] for row in batch})
+        else:
+            condition = tuple_(*columns).in_(
+                {tuple(row[name] for name in conflict_cols) for row in batch}
+            )
+        result = await db.execute(
+            select(func.count()).select_from(self.model).where(condition)
+        )
+        return result.scalar() or 0
+
+    def _upsert_statement(
+        self,
+        dialect: str,
+        batch: List[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]],
+    ) -> Any:
+        if dialect in ("mysql", "mariadb"):
+            stmt = mysql_insert(self.model).values(batch)
+            return stmt.on_duplicate_key_update(
+                self._upsert_set(stmt.inserted, batch, conflict_cols, update_cols)
+            )
+        if dialect in ("postgresql", "sqlite"):
+            insert_ = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert_(self.model).values(batch)
+            return stmt.on_conflict_do_update(
+                index_elements=list(conflict_cols),
+                set_=self._upsert_set(stmt.excluded, batch, conflict_cols, update_cols),
+            )
+        raise NotImplementedError(f"bulk_upsert is not supported on {dialect}")
+
+    def _upsert_set(
+        self,
+        inserted: Any,
+        batch: List[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]],
+    ) -> Dict[str, Any]:
+        primary_keys = {column.key for column in self.model.__table__.primary_key}
+        if update_cols is None:
+            update_cols = [
+                name
+                for name in batch[0]
+                if name not in conflict_cols and name not in primary_keys
+            ]
+        values = {name: getattr(inserted, name) for name in update_cols}
+        # ON DUPLICATE KEY UPDATE does not apply Column.onupdate by itself.
+        for column in self.model.__table__.columns:
+            onupdate = column.onupdate
+            if column.key in values or onupdate is None:
+                continue
+            if onupdate.is_callable:
+                values[column.key] = onupdate.arg(None)
+            elif onupdate.is_scalar:
+                values[column.key] = onupdate.arg
+        return values
+
     async def soft_delete(self, id: Any, session: Optional[AsyncSession] = None) -> Any:
-        db = await self._get_session(session)
-        async with db.begin():
-            obj = await db.get(self.model, id)
-            if not obj:
-                raise NoResultFound(f"{self.model.__name__} with id={id} not found")
-            setattr(obj, "deleted_at", datetime.datetime.now())
-            await db.flush()
-            return obj
+        return await self.update_fields(
+            id,
+            {"deleted_at": datetime.datetime.now()},
+            returning=True,
+            session=session,
+        )
 
     # --- find / query ---
     async def find_by_filter(
@@ -97,18 +295,9 @@ class BaseCrudRepository:
         session: Optional[AsyncSession] = None,
         order_by: Optional[Dict[str, str]] = None,
     ) -> List[Any]:
-        db = await self._get_session(session)
-        async with db.begin():
-            q = select(self.model)
-            for k, v in filter_.items():
-                q = q.where(getattr(self.model, k) == v)
-            if order_by:
-                for k, direction in order_by.items():
-                    col = getattr(self.model, k)
-                    q = q.order_by(
-                        col.asc() if direction.upper() == "ASC" else col.desc()
-                    )
-            result = await db.execute(q)
+        async with self._session_scope(session) as db:
+            q, params = filter_statement(self.model, filter_, order_by)
+            result = await db.execute(q, params)
             return result.scalars().all()
 
     async def find_one_by_filter(
@@ -116,14 +305,36 @@ class BaseCrudRepository:
         filter_: Dict[str, Any],
         session: Optional[AsyncSession] = None,
     ) -> Optional[Any]:
-        db = await self._get_session(session)
-        async with db.begin():
-            q = select(self.model)
-            for k, v in filter_.items():
-                q = q.where(getattr(self.model, k) == v)
-            result = await db.execute(q)
+        async with self._session_scope(session) as db:
+            q, params = filter_statement(self.model, filter_)
+            result = await db.execute(q, params)
             return result.scalars().first()
 
+    async def find_one_from_primary(
+        self,
+        filter_: Dict[str, Any],
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Any]:
+        """Like ``find_one_by_filter``, but always a fresh read on the primary,
+        never from a cache or a replica. Use it for rows that decide
+        authentication, such as password and refresh token digests."""
+        async with self._session_scope(session) as db:
+            q, params = filter_statement(self.model, filter_)
+            result = await db.execute(q, params, bind_arguments={USE_PRIMARY: True})
+            return result.scalars().first()
+
+    async def find_one_with_secret(
+        self,
+        filter_: Dict[str, Any],
+        column: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Tuple[Optional[Any], Any]:
+        """The row matching ``filter_`` and the value of its ``column``, with
+        ``column`` always read fresh from the primary. Returns ``(None, None)``
+        when nothing matches."""
+        obj = await self.find_one_from_primary(filter_, session)
+        return obj, getattr(obj, column) if obj is not None else None
+
     # --- pagination with query builder ---
     async def paginate(
         self,
@@ -132,11 +343,9 @@ class BaseCrudRepository:
         per_page: int = 10,
         session: Optional[AsyncSession] = None,
     ) -> Dict[str, Any]:
-        db = await self._get_session(session)
-        async with db.begin():
+        async with self._session_scope(session) as db:
             q = query_builder_func(db)
-            total = await db.execute(select([q.count()]))
-            total_count = total.scalar() or 0
+            total_count = await self._count(db, q)
             data_result = await db.execute(
                 q.offset((page - 1) * per_page).limit(per_page)
             )
@@ -148,3 +357,70 @@ class BaseCrudRepository:
                 "limit": per_page,
                 "data_list": data_list,
             }
+
+    # --- keyset (cursor) pagination ---
+    async def paginate_keyset(
+        self,
+        query_builder_func: Optional[Callable[[AsyncSession], Any]] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        sort_keys: Sequence[SortKey] = DEFAULT_KEYSET_SORT,
+        with_total: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, Any]:
+        """Seek-based pagination on ``sort_keys``, which should be indexed and
+        end in a unique column. Cost does not grow with page depth.
+        """
+        columns = [getattr(self.model, name) for name, _ in sort_keys]
+        directions = [direction.lower() for _, direction in sort_keys]
+        values, direction = (
+            decode_cursor(cursor, len(sort_keys)) if cursor else (None, NEXT)
+        )
+        backwards = direction == PREV
+
+        async with self._session_scope(session) as db:
+            base = query_builder_func(db) if query_builder_func else select(self.model)
+            q = base
+            if values is not None:
+                q = q.where(seek_predicate(columns, directions, values, backwards))
+            q = q.order_by(
+                *(
+                    col.asc() if (d == "asc") != backwards else col.desc()
+                    for col, d in zip(columns, directions)
+                )
+            ).limit(limit + 1)
+            rows = (await db.execute(q)).scalars().all()
+            total_count = await self._count(db, base) if with_total else None
+
+            has_more = len(rows) > limit
+            rows = list(rows[:limit])
+            if backwards:
+                rows.reverse()
+            has_next = bool(rows) and (True if backwards else has_more)
+            has_prev = bool(rows) and (has_more if backwards else values is not None)
+            # Cursors are read while the rows are still attached to the session.
+            next_cursor = (
+                self._keyset_cursor(rows[-1], sort_keys, NEXT) if has_next else None
+            )
+            prev_cursor = (
+                self._keyset_cursor(rows[0], sort_keys, PREV) if has_prev else None
+            )
+
+        return {
+            "total": total_count,
+            "limit": limit,
+            "data_list": rows,
+            "has_next": has_next,
+            "has_prev": has_prev,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
+
+    @staticmethod
+    def _keyset_cursor(row: Any, sort_keys: Sequence[SortKey], direction: str) -> str:
+        return encode_cursor([getattr(row, name) for name, _ in sort_keys], direction)
+
+    async def _count(self, db: AsyncSession, q: Any) -> int:
+        subquery = q.order_by(None).subquery()
+        result = await db.execute(select(func.count()).select_from(subquery))
+        return result.scalar() or 0
@@ -0,0 +1,242 @@
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.infrastructure.common.cache.cache_backend import ICacheBackend
+from app.infrastructure.configs.routing_session import USE_PRIMARY
+from app.infrastructure.repositories.base_crud_repository import BaseCrudRepository
+from app.infrastructure.repositories.unit_of_work import on_commit
+
+
+class CachedCrudRepository(BaseCrudRepository):
+    """Read-through cache for ``find_one_by_filter`` on the primary key or on a
+    single unique column.
+
+    Rows are cached under ``<table>:<pk>:<id>``; unique columns only store a
+    pointer to the id, and the pointed-to row is checked against the requested
+    value. Writes therefore only need to invalidate primary-key entries.
+    Lookups through the cache always return detached copies, on a hit and on
+    a miss alike.
+
+    The cache is per process, so another worker's writes only show up here
+    once the entry expires. ``uncached_columns`` are left out of the cached
+    rows, and reading them from a returned entity raises; use
+    ``find_one_with_secret`` to get one of them fresh from the primary. Writes
+    that only touch those columns leave the cached row in place, so its
+    ``updated_at`` may lag by up to the TTL.
+    """
+
+    def __init__(
+        self,
+        model: Type,
+        cache: Optional[ICacheBackend] = None,
+        session: Optional[AsyncSession] = None,
+        uncached_columns: Sequence[str] = (),
+    ):
+        super().__init__(model, session)
+        self.cache = cache
+        mapper = inspect(model)
+        self._pk = mapper.primary_key[0].key
+        self._uncached_columns = frozenset(uncached_columns)
+        self._columns = [
+            attr.key
+            for attr in mapper.column_attrs
+            if attr.key not in self._uncached_columns
+        ]
+        self._unique_columns = frozenset(
+            column.key for column in model.__table__.columns if column.unique
+        )
+
+    # --- cache helpers ---
+    def _key(self, column: str, value: Hashable) -> str:
+        return f"{self.model.__tablename__}:{column}:{value}"
+
+    def _snapshot(self, obj: Any) -> Dict[str, Any]:
+        return {column: getattr(obj, column) for column in self._columns}
+
+    def _to_entity(self, row: Dict[str, Any]) -> Any:
+        obj = self.model(**row)
+        make_transient_to_detached(obj)
+        return obj
+
+    async def _cache_get(self, column: str, value: Hashable) -> Optional[Any]:
+        if column == self._pk:
+            row = await self.cache.get(self._key(column, value))
+        else:
+            id_ = await self.cache.get(self._key(column, value))
+            if id_ is None:
+                return None
+            row = await self.cache.get(self._key(self._pk, id_))
+            if row is not None and row.get(column) != value:
+                return None
+        return self._to_entity(row) if row is not None else None
+
+    async def _cache_put(self, obj: Any) -> None:
+        row = self._snapshot(obj)
+        id_ = row[self._pk]
+        await self.cache.set(self._key(self._pk, id_), row)
+        for column in self._unique_columns:
+            if row.get(column) is not None:
+                await self.cache.set(self._key(column, row[column]), id_)
+
+    def _cache_column(self, filter_: Dict[str, Any]) -> Optional[str]:
+        # The single column a lookup on ``filter_`` can be served from.
+        if self.cache is None or len(filter_) != 1:
+            return None
+        (column,) = filter_
+        if column != self._pk and column not in self._unique_columns:
+            return None
+        return column
+
+    async def _invalidate(
+        self,
+        ids: Iterable[Any],
+        session: Optional[AsyncSession] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if self.cache is None:
+            return
+        if data is not None and self._uncached_columns.issuperset(data):
+            # Nothing the cache holds has changed.
+            return
+        keys = [self._key(self._pk, id_) for id_ in ids]
+        await self.cache.delete_many(keys)
+        db = session or self.session
+        if db is not None and db.in_transaction():
+            # Readers may re-cache the old row before the commit lands.
+            on_commit(db, lambda: self.cache.delete_many(keys))
+
+    async def _invalidate_all(self, session: Optional[AsyncSession] = None) -> None:
+        if self.cache is None:
+            return
+        await self.cache.clear()
+        db = session or self.session
+        if db is not None and db.in_transaction():
+            on_commit(db, self.cache.clear)
+
+    # --- reads ---
+    async def find_one_by_filter(
+        self,
+        filter_: Dict[str, Any],
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Any]:
+        column = self._cache_column(filter_)
+        if column is None:
+            return await super().find_one_by_filter(filter_, session)
+        obj = await self._cache_get(column, filter_[column])
+        if obj is not None:
+            return obj
+        obj = await self._load(filter_, session)
+        return self._to_entity(self._snapshot(obj)) if obj is not None else None
+
+    async def find_one_with_secret(
+        self,
+        filter_: Dict[str, Any],
+        column: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Tuple[Optional[Any], Any]:
+        """The cached row for ``filter_`` plus ``column`` read from the
+        primary: one single-column SELECT on a hit, one full-row SELECT that
+        also fills the cache on a miss."""
+        cache_column = self._cache_column(filter_)
+        if cache_column is None:
+            return await super().find_one_with_secret(filter_, column, session)
+        obj = await self._cache_get(cache_column, filter_[cache_column])
+        if obj is None:
+            obj = await self._load(filter_, session)
+            if obj is None:
+                return None, None
+            return self._to_entity(self._snapshot(obj)), getattr(obj, column)
+
+        id_ = getattr(obj, self._pk)
+        async with self._session_scope(session) as db:
+            result = await db.execute(
+                select(getattr(self.model, column)).where(
+                    getattr(self.model, self._pk) == id_
+                ),
+                bind_arguments={USE_PRIMARY: True},
+            )
+            row = result.first()
+        if row is None:
+            # Deleted through another worker since it was cached.
+            await self._invalidate([id_], session)
+            return None, None
+        return obj, row[0]
+
+    async def _load(
+        self, filter_: Dict[str, Any], session: Optional[AsyncSession]
+    ) -> Optional[Any]:
+        # Misses read from the primary: a lagging replica could otherwise put
+        # a just-overwritten row back into the cache.
+        obj = await self.find_one_from_primary(filter_, session)
+        if obj is not None:
+            await self._cache_put(obj)
+        return obj
+
+    # --- writes ---
+    async def update(
+        self, id: Any, data: Dict[str, Any], session: Optional[AsyncSession] = None
+    ) -> Any:
+        obj = await super().update(id, data, session)
+        await self._invalidate([id], session, data)
+        return obj
+
+    async def update_fields(
+        self,
+        id: Any,
+        data: Dict[str, Any],
+        *,
+        returning: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> Any:
+        obj = await super().update_fields(
+            id, data, returning=returning, session=session
+        )
+        await self._invalidate([id], session, data)
+        return obj
+
+    async def upsert(
+        self, data: Dict[str, Any], session: Optional[AsyncSession] = None
+    ) -> Any:
+        obj = await super().upsert(data, session)
+        await self._invalidate([getattr(obj, self._pk)], session)
+        return obj
+
+    async def delete(self, id: Any, session: Optional[AsyncSession] = None) -> None:
+        await super().delete(id, session)
+        await self._invalidate([id], session)
+
+    async def bulk_delete(
+        self, ids: List[Any], session: Optional[AsyncSession] = None
+    ) -> int:
+        count = await super().bulk_delete(ids, session)
+        await self._invalidate(ids, session)
+        return count
+
+    async def bulk_upsert(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, int]:
+        counts = await super().bulk_upsert(
+            rows, conflict_cols, update_cols, batch_size, session
+        )
+        if counts["updated"]:
+            # Updated ids are not known up front, so drop everything.
+            await self._invalidate_all(session)
+        return counts
@@ -0,0 +1,69 @@
+import base64
+import datetime
+import json
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+from app.infrastructure.common.exceptions.http_exceptions import BadRequestException
+
+SortKey = Tuple[str, str]  # (column name, "asc" | "desc")
+
+NEXT = "next"
+PREV = "prev"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], direction: str = NEXT) -> str:
+    """Opaque cursor holding the sort-key values of a boundary row."""
+    raw = json.dumps(
+        {"v": [_encode_value(v) for v in values], "d": direction},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, key_count: int) -> Tuple[List[Any], str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_value(v) for v in data["v"]]
+        direction = data["d"]
+    except (ValueError, KeyError, TypeError):
+        raise BadRequestException("Invalid pagination cursor")
+    if len(values) != key_count or direction not in (NEXT, PREV):
+        raise BadRequestException("Invalid pagination cursor")
+    return values, direction
+
+
+def seek_predicate(
+    columns: Sequence[Any],
+    directions: Sequence[str],
+    values: Sequence[Any],
+    backwards: bool,
+):
+    """Rows strictly after ``values`` in the given order (before, if backwards).
+
+    Expanded as ``a >= :a AND (a > :a OR (a = :a AND b > :b) ...)`` rather than
+    a row-value comparison so mixed directions work; the leading inclusive bound
+    gives every backend an index range to seek on.
+    """
+    ascending = [(d == "asc") != backwards for d in directions]
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        step = column > value if ascending[i] else column < value
+        equal = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal, step) if equal else step)
+    lead = columns[0] >= values[0] if ascending[0] else columns[0] <= values[0]
+    return and_(lead, or_(*clauses))
@@ -0,0 +1,67 @@
+import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.configs.routing_session import USE_PRIMARY
+from app.infrastructure.entities.revoked_token_entity import RevokedTokenEntity
+from app.infrastructure.repositories.base_crud_repository import BaseCrudRepository
+
+
+class RevokedTokenRepository(BaseCrudRepository):
+    """Persisted denylist of access-token ids, kept until the token expires."""
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        super().__init__(RevokedTokenEntity, session=session)
+
+    async def revoke(
+        self,
+        jti: str,
+        user_id: str,
+        expires_at: datetime.datetime,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        # Idempotent: concurrent logouts with the same token both succeed
+        # instead of the second failing on the primary key.
+        await self.bulk_upsert(
+            [
+                {
+                    "jti": jti,
+                    "user_id": user_id,
+                    "expires_at": expires_at,
+                    "created_at": datetime.datetime.utcnow(),
+                }
+            ],
+            conflict_cols=("jti",),
+            update_cols=("expires_at",),
+            session=session,
+        )
+
+    async def is_revoked(self, jti: str) -> bool:
+        q = select(RevokedTokenEntity.jti).where(RevokedTokenEntity.jti == jti)
+        async with self._session_scope() as db:
+            # A replica may not have the revocation yet.
+            result = await db.execute(q, bind_arguments={USE_PRIMARY: True})
+            return result.first() is not None
+
+    async def find_active(
+        self, since: Optional[datetime.datetime] = None
+    ) -> List[Tuple[str, datetime.datetime]]:
+        """Unexpired revocations, optionally only those recorded after ``since``."""
+        q = select(RevokedTokenEntity.jti, RevokedTokenEntity.expires_at).where(
+            RevokedTokenEntity.expires_at > datetime.datetime.utcnow()
+        )
+        if since is not None:
+            q = q.where(RevokedTokenEntity.created_at >= since)
+        async with self._session_scope() as db:
+            result = await db.execute(q)
+            return [tuple(row) for row in result.all()]
+
+    async def prune_expired(self) -> int:
+        q = delete(RevokedTokenEntity).where(
+            RevokedTokenEntity.expires_at <= datetime.datetime.utcnow()
+        )
+        async with self._session_scope(for_write=True) as db:
+            result = await db.execute(q)
+            return result.rowcount
@@ -0,0 +1,64 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
+
+from sqlalchemy import bindparam, select
+
+from app.infrastructure.configs.app_config import app_settings
+
+# Filter values are bound as ``:f_<column>``.
+PARAM_PREFIX = "f_"
+
+FilterShape = Tuple[Tuple[str, ...], Tuple[str, ...]]  # (bound keys, IS NULL keys)
+OrderShape = Tuple[Tuple[str, str], ...]  # ((column, "ASC" | "DESC"), ...)
+
+
+@lru_cache(maxsize=app_settings.statement_cache_size)
+def _template(model: Type, shape: FilterShape, order: OrderShape) -> Any:
+    bound_keys, null_keys = shape
+    q = select(model)
+    for key in bound_keys:
+        q = q.where(getattr(model, key) == bindparam(PARAM_PREFIX + key))
+    for key in null_keys:
+        q = q.where(getattr(model, key).is_(None))
+    for key, direction in order:
+        column = getattr(model, key)
+        q = q.order_by(column.asc() if direction == "ASC" else column.desc())
+    return q
+
+
+def filter_statement(
+    model: Type,
+    filter_: Dict[str, Any],
+    order_by: Optional[Dict[str, str]] = None,
+) -> Tuple[Any, Dict[str, Any]]:
+    """``SELECT model WHERE k = :f_k ...`` and its parameters for ``filter_``.
+
+    The statement is built once per (model, filter keys, order-by shape) and
+    reused, so a call only binds values; SQLAlchemy's compiled cache is then
+    hit without rebuilding or re-hashing the statement. ``None`` values become
+    ``IS NULL`` and are part of the shape.
+    """
+    bound_keys = tuple(sorted(k for k, v in filter_.items() if v is not None))
+    null_keys = tuple(sorted(k for k, v in filter_.items() if v is None))
+    order: OrderShape = tuple(
+        (key, "ASC" if direction.upper() == "ASC" else "DESC")
+        for key, direction in (order_by or {}).items()
+    )
+    params = {PARAM_PREFIX + key: filter_[key] for key in bound_keys}
+    return _template(model, (bound_keys, null_keys), order), params
+
+
+def statement_cache_info() -> Dict[str, Any]:
+    info = _template.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def clear_statement_cache() -> None:
+    _template.cache_clear()
@@ -0,0 +1,49 @@
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.repositories.unit_of_work import IUnitOfWork
+from app.infrastructure.configs.db_config import AsyncSessionLocal
+
+ON_COMMIT_KEY = "on_commit"
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run ``callback`` after the unit of work owning ``session`` commits."""
+    session.info.setdefault(ON_COMMIT_KEY, []).append(callback)
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """Shares one AsyncSession and one transaction between repositories.
+
+    The transaction is committed once when the block exits cleanly and rolled
+    back otherwise; the session is always closed so its connection goes back
+    to the pool.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+        self.session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> "SqlAlchemyUnitOfWork":
+        self.session = self.session_factory()
+        await self.session.begin()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        for callback in self.session.info.pop(ON_COMMIT_KEY, []):
+            await callback()
+
+    async def rollback(self) -> None:
+        self.session.info.pop(ON_COMMIT_KEY, None)
+        await self.session.rollback()
@@ -1,9 +1,26 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.common.cache.cache_backend import ICacheBackend
 from app.infrastructure.entities.user_entity import UserEntity
-from app.infrastructure.repositories.base_crud_repository import BaseCrudRepository
+from app.infrastructure.repositories.cached_crud_repository import (
+    CachedCrudRepository,
+)
+
+# Never cached: each worker has its own cache, so a digest cached in one would
+# outlive a change made through another.
+SECRET_COLUMNS = ("hashed_password", "hashed_refresh_token")
 
 
-class UserRepository(BaseCrudRepository):
+class UserRepository(CachedCrudRepository):
     """User repository for managing user-related database operations."""
 
-    def __init__(self):
-        super().__init__(UserEntity)
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        cache: Optional[ICacheBackend] = None,
+    ):
+        super().__init__(
+            UserEntity, cache=cache, session=session, uncached_columns=SECRET_COLUMNS
+        )
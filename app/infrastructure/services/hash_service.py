@@ -1,12 +1,115 @@
-from app.domain.adapters.hashing import IHashService
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
 import bcrypt
 
+from app.domain.adapters.hashing import IHashService
+from app.infrastructure.common.metrics.app_metrics import (
+    bcrypt_calls_total,
+    bcrypt_duration_seconds,
+)
+from app.infrastructure.common.exceptions.http_exceptions import (
+    ServiceUnavailableException,
+)
+from app.infrastructure.configs.app_config import app_settings
+
+
+def bcrypt_hash(plain_text: str) -> str:
+    salt = bcrypt.gensalt()
+    hashed = bcrypt.hashpw(plain_text.encode("utf-8"), salt)
+    return hashed.decode("utf-8")
+
+
+def bcrypt_verify(plain_text: str, hashed_text: str) -> bool:
+    return bcrypt.checkpw(plain_text.encode("utf-8"), hashed_text.encode("utf-8"))
+
+
+def _timed(func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    # Runs in the worker, so the duration excludes the wait for a free worker.
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class HashWorkerPool:
+    """Bounded executor that keeps bcrypt work off the event loop.
+
+    Calls beyond ``max_pending`` (running + queued) are rejected immediately
+    with a 503 instead of piling up behind the workers.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 4,
+        max_pending: int = 64,
+    ) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported hash executor: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            raise ServiceUnavailableException("Server is busy, please retry later")
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+hash_worker_pool = HashWorkerPool(
+    kind=app_settings.hash_executor,
+    max_workers=app_settings.hash_max_workers,
+    max_pending=app_settings.hash_max_pending,
+)
+
 
 class HashService(IHashService):
-    def hash(self, plain_text: str) -> str:
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(plain_text.encode("utf-8"), salt)
-        return hashed.decode("utf-8")
+    def __init__(self, pool: Optional[HashWorkerPool] = None) -> None:
+        self.pool = pool or hash_worker_pool
+
+    async def hash(self, plain_text: str) -> str:
+        return await self._run("hash", bcrypt_hash, plain_text)
+
+    async def verify(self, plain_text: str, hashed_text: str) -> bool:
+        return await self._run("verify", bcrypt_verify, plain_text, hashed_text)
 
-    def verify(self, plain_text: str, hashed_text: str) -> bool:
-        return bcrypt.checkpw(plain_text.encode("utf-8"), hashed_text.encode("utf-8"))
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        try:
+            result, elapsed = await self.pool.run(_timed, func, *args)
+        except ServiceUnavailableException:
+            bcrypt_calls_total.inc(operation, "rejected")
+            raise
+        except Exception:
+            bcrypt_calls_total.inc(operation, "error")
+            raise
+        bcrypt_calls_total.inc(operation, "ok")
+        bcrypt_duration_seconds.observe(operation, value=elapsed)
+        return result
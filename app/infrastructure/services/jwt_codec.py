@@ -0,0 +1,172 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict
+
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
+
+from app.infrastructure.configs.app_config import app_settings
+
+ALGORITHM = "HS256"
+# Tolerated clock difference between the worker that issued a token and the
+# one checking its iat.
+IAT_LEEWAY_SECONDS = 30
+
+
+class InvalidTokenError(Exception):
+    pass
+
+
+class TokenExpiredError(InvalidTokenError):
+    pass
+
+
+class JWTCodec(ABC):
+    """Signs and verifies HS256 tokens with one secret.
+
+    ``decode`` pins the algorithm, checks the signature, and rejects tokens
+    whose ``exp`` has passed, whose ``nbf`` is still ahead, or whose ``iat``
+    lies in the future.
+    Claims the application defines, like ``type``, are checked by the caller.
+    """
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        pass
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        pass
+
+
+class JoseCodec(JWTCodec):
+    def __init__(self, secret: str) -> None:
+        self.secret = secret
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return jwt.encode(claims, self.secret, algorithm=ALGORITHM)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            claims = jwt.decode(token, self.secret, algorithms=[ALGORITHM])
+        except ExpiredSignatureError as exc:
+            raise TokenExpiredError(str(exc)) from exc
+        except JWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+        # jose only checks that iat is an integer.
+        _check_issued_at(claims, int(time.time()))
+        return claims
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(segment: bytes) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidTokenError("invalid segment padding") from exc
+
+
+def _numeric(claims: Dict[str, Any], name: str) -> Any:
+    value = claims.get(name)
+    if value is not None and (
+        isinstance(value, bool) or not isinstance(value, (int, float))
+    ):
+        raise InvalidTokenError(f"{name} claim must be a number")
+    return value
+
+
+def _check_issued_at(claims: Dict[str, Any], now: int) -> None:
+    iat = _numeric(claims, "iat")
+    if iat is not None and iat > now + IAT_LEEWAY_SECONDS:
+        raise InvalidTokenError("token iat is in the future")
+
+
+class HS256Codec(JWTCodec):
+    """Minimal HS256 codec on top of ``hmac``.
+
+    The keyed HMAC state and the encoded header are computed once, so issuing
+    or checking a token costs one ``hmac.copy()``, two base64 calls and one
+    JSON (de)serialization.
+    """
+
+    HEADER = {"alg": ALGORITHM, "typ": "JWT"}
+
+    def __init__(self, secret: str) -> None:
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header = _b64encode(
+            json.dumps(self.HEADER, separators=(",", ":")).encode()
+        )
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return _b64encode(mac.digest())
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        signing_input = (
+            self._header
+            + b"."
+            + _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        )
+        return (signing_input + b"." + self._sign(signing_input)).decode("ascii")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            raw = token.encode("ascii")
+        except (UnicodeEncodeError, AttributeError) as exc:
+            raise InvalidTokenError("token is not ascii") from exc
+        if raw.count(b".") != 2:
+            raise InvalidTokenError("token must have three segments")
+        signing_input, _, signature = raw.rpartition(b".")
+        header, _, payload = signing_input.partition(b".")
+
+        if header != self._header:
+            # Tokens from other encoders may order or space the header
+            # differently; the algorithm is still pinned.
+            try:
+                fields = json.loads(_b64decode(header))
+            except ValueError as exc:
+                raise InvalidTokenError("invalid header") from exc
+            if not isinstance(fields, dict) or fields.get("alg") != ALGORITHM:
+                raise InvalidTokenError("the specified alg value is not allowed")
+
+        if not hmac.compare_digest(signature, self._sign(signing_input)):
+            raise InvalidTokenError("signature verification failed")
+
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError as exc:
+            raise InvalidTokenError("invalid payload") from exc
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("payload must be a JSON object")
+
+        now = int(time.time())
+        exp = _numeric(claims, "exp")
+        if exp is not None and exp < now:
+            raise TokenExpiredError("signature has expired")
+        nbf = _numeric(claims, "nbf")
+        if nbf is not None and nbf > now:
+            raise InvalidTokenError("the token is not yet valid (nbf)")
+        _check_issued_at(claims, now)
+        return claims
+
+
+JWT_CODECS = {"hs256": HS256Codec, "jose": JoseCodec}
+
+
+@lru_cache(maxsize=None)
+def get_jwt_codec(secret: str, name: str = "") -> JWTCodec:
+    """Shared codec for ``secret``, so precomputed state outlives requests."""
+    name = name or app_settings.jwt_codec
+    if name not in JWT_CODECS:
+        raise ValueError(f"Unsupported JWT codec: {name}")
+    return JWT_CODECS[name](secret)
@@ -1,18 +1,22 @@
 import time
 from typing import Any, Dict
 
-from jose import jwt
-from jose.exceptions import JWTError, ExpiredSignatureError
-
 from app.domain.adapters.jwt import IJWTService
 from app.infrastructure.common.exceptions.http_exceptions import UnauthorizedException
 from app.infrastructure.configs import app_config
+from app.infrastructure.entities.id_types import new_id
+from app.infrastructure.services.jwt_codec import (
+    InvalidTokenError,
+    TokenExpiredError,
+    get_jwt_codec,
+)
 
 
 class JWTService(IJWTService):
-    def __init__(self) -> None:
+    def __init__(self, codec: str = "") -> None:
         self.settings = app_config.app_settings
-        self.alg = "HS256"
+        self.access_codec = get_jwt_codec(self.settings.jwt_access_secret, codec)
+        self.refresh_codec = get_jwt_codec(self.settings.jwt_refresh_secret, codec)
 
     def _now_ts(self) -> int:
         return int(time.time())
@@ -20,39 +24,40 @@ class JWTService(IJWTService):
     def generate_access_token(self, payload: Dict[str, Any]) -> str:
         now = self._now_ts()
         exp = now + int(self.settings.jwt_access_expires_seconds)
-        data = {**payload, "exp": exp, "iat": now, "type": "access"}
-        token = jwt.encode(data, self.settings.jwt_access_secret, algorithm=self.alg)
-        return token
+        data = {
+            **payload,
+            "exp": exp,
+            "iat": now,
+            "type": "access",
+            # Time-ordered, so revoked_tokens inserts append to its primary key.
+            "jti": new_id(),
+        }
+        return self.access_codec.encode(data)
 
     def generate_refresh_token(self, payload: Dict[str, Any]) -> str:
         now = self._now_ts()
         exp = now + int(self.settings.jwt_refresh_expires_seconds)
         data = {**payload, "exp": exp, "iat": now, "type": "refresh"}
-        token = jwt.encode(data, self.settings.jwt_refresh_secret, algorithm=self.alg)
-        return token
+        return self.refresh_codec.encode(data)
 
     def verify_access_token(self, token: str) -> Dict[str, Any]:
         try:
-            payload = jwt.decode(
-                token,
-                self.settings.jwt_access_secret,
-                algorithms=[self.alg],
-            )
-            return payload
-        except ExpiredSignatureError:
+            payload = self.access_codec.decode(token)
+        except TokenExpiredError:
             raise UnauthorizedException("access token expired")
-        except JWTError as exc:
+        except InvalidTokenError as exc:
             raise UnauthorizedException(f"invalid access token: {exc}")
+        if payload.get("type") != "access":
+            raise UnauthorizedException("invalid access token: wrong token type")
+        return payload
 
     def verify_refresh_token(self, token: str) -> Dict[str, Any]:
         try:
-            payload = jwt.decode(
-                token,
-                self.settings.jwt_refresh_secret,
-                algorithms=[self.alg],
-            )
-            return payload
-        except ExpiredSignatureError:
+            payload = self.refresh_codec.decode(token)
+        except TokenExpiredError:
             raise UnauthorizedException("refresh token expired")
-        except JWTError as exc:
+        except InvalidTokenError as exc:
             raise UnauthorizedException(f"invalid refresh token: {exc}")
+        if payload.get("type") != "refresh":
+            raise UnauthorizedException("invalid refresh token: wrong token type")
+        return payload
@@ -0,0 +1,60 @@
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Optional
+
+from app.domain.adapters.hashing import IHashService
+from app.domain.adapters.token_digest import ITokenDigestService
+from app.infrastructure.configs.app_config import app_settings
+
+HMAC_DIGEST_PREFIX = "hmac-sha256$"
+
+
+@lru_cache(maxsize=1)
+def _derive_digest_key() -> bytes:
+    if app_settings.refresh_token_digest_secret:
+        return app_settings.refresh_token_digest_secret.encode("utf-8")
+    # Keep the digest key distinct from the key that signs refresh tokens.
+    return hmac.new(
+        app_settings.jwt_refresh_secret.encode("utf-8"),
+        b"refresh-token-digest",
+        hashlib.sha256,
+    ).digest()
+
+
+class TokenDigestService(ITokenDigestService):
+    """Stores refresh tokens as keyed HMAC-SHA256 digests.
+
+    Refresh tokens are already high-entropy signed JWTs, so a slow password
+    hash adds CPU cost without adding security. Legacy bcrypt digests are still
+    accepted and get replaced by an HMAC digest on the next rotation.
+    """
+
+    def __init__(
+        self,
+        hash_service: IHashService,
+        mode: Optional[str] = None,
+        key: Optional[bytes] = None,
+    ) -> None:
+        self.hash_service = hash_service
+        self.mode = mode or app_settings.refresh_token_digest_mode
+        if self.mode not in ("hmac", "bcrypt"):
+            raise ValueError(f"Unsupported refresh token digest mode: {self.mode}")
+        self._mac = hmac.new(key or _derive_digest_key(), digestmod=hashlib.sha256)
+
+    def _hmac_digest(self, token: str) -> str:
+        mac = self._mac.copy()
+        mac.update(token.encode("utf-8"))
+        return HMAC_DIGEST_PREFIX + mac.hexdigest()
+
+    async def digest(self, token: str) -> str:
+        if self.mode == "bcrypt":
+            return await self.hash_service.hash(token)
+        return self._hmac_digest(token)
+
+    async def verify(self, token: str, stored_digest: Optional[str]) -> bool:
+        if not stored_digest:
+            return False
+        if stored_digest.startswith(HMAC_DIGEST_PREFIX):
+            return hmac.compare_digest(stored_digest, self._hmac_digest(token))
+        return await self.hash_service.verify(token, stored_digest)
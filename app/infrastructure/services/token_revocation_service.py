@@ -0,0 +1,139 @@
+import datetime
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.domain.adapters.token_revocation import ITokenRevocationService
+from app.domain.repositories.revoked_token_repo import IRevokedTokenRepository
+from app.infrastructure.common.cache.bloom_filter import BloomFilter
+from app.infrastructure.common.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.configs.app_config import app_settings
+from app.infrastructure.repositories.revoked_token_repository import (
+    RevokedTokenRepository,
+)
+from app.infrastructure.repositories.unit_of_work import on_commit
+
+logger = logging.getLogger("app.auth")
+
+
+class TokenDenylist:
+    """Per-worker view of the revoked access tokens.
+
+    A Bloom filter holds every unexpired revocation loaded from the store, so
+    a token that was never revoked is answered without I/O. Only filter hits
+    are looked up, and their answer is kept in a small exact cache: revoked
+    ids until the token expires, false positives until the next sync.
+    Revocations made by other workers are picked up by ``sync``.
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], IRevokedTokenRepository] = (
+            RevokedTokenRepository
+        ),
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        sync_seconds: Optional[float] = None,
+        exact_size: int = 10000,
+    ) -> None:
+        self.repository_factory = repository_factory
+        self.capacity = capacity or app_settings.token_denylist_capacity
+        self.error_rate = error_rate or app_settings.token_denylist_error_rate
+        self.sync_seconds = (
+            app_settings.token_denylist_sync_seconds
+            if sync_seconds is None
+            else sync_seconds
+        )
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._exact = TTLLRUCache(max_size=exact_size)
+        self._synced_at: Optional[datetime.datetime] = None
+        self.lookups = 0
+
+    def add(self, jti: str, expires_at: Optional[float] = None) -> None:
+        self._bloom.add(jti)
+        self._exact.set(jti, True, expires_at=expires_at)
+
+    async def is_revoked(self, jti: str, expires_at: Optional[float] = None) -> bool:
+        known = self._exact.get(jti)
+        if known is not None:
+            return known
+        if jti not in self._bloom:
+            return False
+        self.lookups += 1
+        revoked = await self.repository_factory().is_revoked(jti)
+        self._exact.set(
+            jti,
+            revoked,
+            expires_at=expires_at if revoked else time.time() + self.sync_seconds,
+        )
+        return revoked
+
+    async def sync(self, full: bool = False) -> int:
+        """Load revocations recorded since the last sync, or all of them
+        into a fresh filter when ``full`` (which also drops expired ids)."""
+        started = datetime.datetime.utcnow()
+        since = None
+        if not full and self._synced_at is not None:
+            # Overlap absorbs rows committed late or stamped by a skewed clock.
+            since = self._synced_at - datetime.timedelta(seconds=self.sync_seconds)
+        rows = await self.repository_factory().find_active(since)
+        if since is None:
+            bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+        else:
+            bloom = self._bloom
+        for jti, _ in rows:
+            bloom.add(jti)
+        # Local revocations made during a rebuild are still in the exact cache.
+        self._bloom = bloom
+        self._synced_at = started
+        return len(rows)
+
+    async def prune(self) -> int:
+        """Delete expired revocations and rebuild the filter without them."""
+        pruned = await self.repository_factory().prune_expired()
+        await self.sync(full=True)
+        return pruned
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "filter_items": len(self._bloom),
+            "exact": len(self._exact),
+            "lookups": self.lookups,
+        }
+
+
+token_denylist = TokenDenylist()
+
+
+class TokenRevocationService(ITokenRevocationService):
+    def __init__(
+        self,
+        repository: IRevokedTokenRepository,
+        denylist: Optional[TokenDenylist] = None,
+    ) -> None:
+        self.repository = repository
+        self.denylist = denylist or token_denylist
+
+    async def revoke(self, payload: Dict[str, Any]) -> None:
+        jti = payload.get("jti")
+        exp = payload.get("exp")
+        if not jti or exp is None:
+            # Tokens issued before ids were added simply run out.
+            return
+        await self.repository.revoke(
+            jti,
+            payload["user"]["id"],
+            datetime.datetime.utcfromtimestamp(exp),
+        )
+
+        async def publish() -> None:
+            self.denylist.add(jti, expires_at=exp)
+
+        db = self.repository.session
+        if db is not None and db.in_transaction():
+            on_commit(db, publish)
+        else:
+            await publish()
+
+    async def is_revoked(self, jti: str, expires_at: Optional[float] = None) -> bool:
+        return await self.denylist.is_revoked(jti, expires_at)
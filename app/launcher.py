@@ -0,0 +1,164 @@
+"""Server entry point used by ``make run``.
+
+With ``APP_ENVIRONMENT=production`` the app is served by several worker
+processes: gunicorn with uvicorn workers when gunicorn is installed, which is
+what makes preloading and jittered recycling possible, and uvicorn's own
+process manager otherwise. Any other environment runs a single auto-reloading
+uvicorn process.
+"""
+
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict
+
+import uvicorn
+
+from infrastructure.configs.app_config import app_settings
+
+APP = "main:app"
+
+logger = logging.getLogger("launcher")
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_loop() -> str:
+    if app_settings.server_loop != "auto":
+        return app_settings.server_loop
+    return "uvloop" if _installed("uvloop") else "asyncio"
+
+
+def resolve_http() -> str:
+    if app_settings.server_http != "auto":
+        return app_settings.server_http
+    return "httptools" if _installed("httptools") else "h11"
+
+
+def worker_count() -> int:
+    return app_settings.server_workers or os.cpu_count() or 1
+
+
+def prepare_metrics_dir(workers: int) -> None:
+    """Give the workers an empty shared metrics directory.
+
+    Snapshots left by a previous run would otherwise be added to the new
+    counters. Set through the environment so the workers, which build their
+    own settings, pick it up.
+    """
+    if not app_settings.metrics_enabled or workers < 2:
+        return
+    path = app_settings.metrics_multiprocess_dir
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+    else:
+        path = tempfile.mkdtemp(prefix="aicademy-metrics-")
+    os.environ["METRICS_MULTIPROCESS_DIR"] = path
+
+
+def run_gunicorn(workers: int, loop: str, http: str) -> None:
+    from gunicorn.app.base import BaseApplication
+    from uvicorn_worker import UvicornWorker
+
+    class Worker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": loop,
+            "http": http,
+            "timeout_graceful_shutdown": app_settings.server_graceful_timeout,
+        }
+
+    class Server(BaseApplication):
+        def __init__(self, options: Dict[str, Any]):
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+
+            return app
+
+    Server(
+        {
+            "bind": f"{app_settings.server_host}:{app_settings.server_port}",
+            "workers": workers,
+            "worker_class": Worker,
+            "preload_app": app_settings.server_preload,
+            "max_requests": app_settings.server_max_requests,
+            "max_requests_jitter": app_settings.server_max_requests_jitter,
+            "keepalive": app_settings.server_keep_alive_seconds,
+            "backlog": app_settings.server_backlog,
+            "graceful_timeout": app_settings.server_graceful_timeout,
+            "loglevel": app_settings.server_log_level,
+        }
+    ).run()
+
+
+def run_uvicorn(workers: int, loop: str, http: str) -> None:
+    if app_settings.server_preload or app_settings.server_max_requests_jitter:
+        logger.warning(
+            "gunicorn is not installed; SERVER_PRELOAD and "
+            "SERVER_MAX_REQUESTS_JITTER are ignored"
+        )
+    uvicorn.run(
+        APP,
+        host=app_settings.server_host,
+        port=app_settings.server_port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        limit_max_requests=app_settings.server_max_requests or None,
+        timeout_keep_alive=app_settings.server_keep_alive_seconds,
+        timeout_graceful_shutdown=app_settings.server_graceful_timeout,
+        backlog=app_settings.server_backlog,
+        log_level=app_settings.server_log_level,
+    )
+
+
+def run_production() -> None:
+    workers = worker_count()
+    loop, http = resolve_loop(), resolve_http()
+    prepare_metrics_dir(workers)
+    use_gunicorn = _installed("gunicorn") and _installed("uvicorn_worker")
+    logger.info(
+        "Starting %d %s worker(s), loop=%s http=%s",
+        workers,
+        "gunicorn" if use_gunicorn else "uvicorn",
+        loop,
+        http,
+    )
+    if use_gunicorn:
+        run_gunicorn(workers, loop, http)
+    else:
+        run_uvicorn(workers, loop, http)
+
+
+def run_development() -> None:
+    uvicorn.run(
+        APP,
+        host=app_settings.server_host,
+        port=app_settings.server_port,
+        reload=app_settings.server_reload,
+        log_level=app_settings.server_log_level,
+        reload_dirs=["."],
+    )
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    if app_settings.app_environment == "production":
+        run_production()
+    else:
+        run_development()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,29 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-import uvicorn
+from infrastructure.common.middlewares.compression_middleware import (
+    CompressionMiddleware,
+)
+from infrastructure.common.middlewares.conditional_get_middleware import (
+    ConditionalGetMiddleware,
+)
 from infrastructure.common.middlewares.jwt_middleware import JWTMiddleware
+from infrastructure.common.middlewares.metrics_middleware import MetricsMiddleware
+from infrastructure.common.middlewares.request_id_middleware import (
+    RequestIdMiddleware,
+)
+from infrastructure.common.middlewares.sql_profiler_middleware import (
+    SqlProfilerMiddleware,
+)
 from infrastructure.common.middlewares.response_interceptor import (
     ResponseInterceptorMiddleware,
 )
 from infrastructure.controllers.controllers import api_router
+from infrastructure.controllers.metrics.metrics_controller import (
+    router as metrics_router,
+)
 from infrastructure.configs.app_config import app_settings
+from infrastructure.configs.lifespan import lifespan
 from infrastructure.common.exceptions.validation_exception_handler import (
     validation_exception_handler,
 )
@@ -23,6 +39,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         openapi_version="3.1.0",
+        lifespan=lifespan,
     )
 
     app.openapi_tags = [
@@ -40,10 +57,23 @@ def create_app() -> FastAPI:
         allow_headers=app_settings.cors_headers,
     )
     app.add_middleware(JWTMiddleware)
+    # Inside the envelope: tags the payload it wraps and its 304s pass through.
+    if app_settings.etag_enabled:
+        app.add_middleware(ConditionalGetMiddleware)
     app.add_middleware(ResponseInterceptorMiddleware)
+    if app_settings.app_debug:
+        app.add_middleware(SqlProfilerMiddleware)
+    if app_settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+    # Outermost, so it compresses the final envelope bytes.
+    if app_settings.compression_enabled:
+        app.add_middleware(CompressionMiddleware)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
     app.include_router(api_router)
+    if app_settings.metrics_enabled:
+        app.include_router(metrics_router)
 
     return app
 
@@ -84,20 +114,6 @@ async def root():
 
 
 if __name__ == "__main__":
-    if app_settings.app_environment == "production":
-        uvicorn.run(
-            "main:app",
-            host=app_settings.server_host,
-            port=app_settings.server_port,
-            reload=False,
-            log_level=app_settings.server_log_level,
-        )
-    else:
-        uvicorn.run(
-            "main:app",
-            host=app_settings.server_host,
-            port=app_settings.server_port,
-            reload=True,
-            log_level=app_settings.server_log_level,
-            reload_dirs=["."],
-        )
+    from launcher import main
+
+    main()
@@ -1,33 +1,48 @@
+from sqlalchemy.exc import IntegrityError
+
 from app.domain.adapters.hashing import IHashService
 from app.domain.adapters.jwt import IJWTService
+from app.domain.adapters.token_digest import ITokenDigestService
+from app.domain.adapters.token_revocation import ITokenRevocationService
 from app.domain.repositories.user_repo import IUserRepository
 from app.infrastructure.common.exceptions.http_exceptions import (
     NotFoundException,
     BadRequestException,
     UnauthorizedException,
 )
+from app.infrastructure.entities.id_types import new_id
 from app.infrastructure.entities.user_entity import UserEntity
 from infrastructure.controllers.auth.dto.register_dto import RegisterDto
 
 
+# User fields copied into token payloads.
+USER_CLAIMS = ("id", "email", "full_name", "avatar_url", "is_admin")
+
+
 class AuthUseCases:
     def __init__(
         self,
         user_repository: IUserRepository,
         jwt_service: IJWTService,
         hash_service: IHashService,
+        token_digest_service: ITokenDigestService,
+        token_revocation_service: ITokenRevocationService,
     ) -> None:
 
         self.userRepo = user_repository
         self.jwt_service = jwt_service
         self.hash_service = hash_service
+        self.token_digest_service = token_digest_service
+        self.token_revocation_service = token_revocation_service
 
     async def login(self, email: str, password: str) -> bool:
-        user = await self.userRepo.find_one_by_filter({"email": email})
+        user, hashed_password = await self.userRepo.find_one_with_secret(
+            {"email": email}, "hashed_password"
+        )
         if not user:
             raise NotFoundException("User not found")
 
-        if not self.hash_service.verify(password, user.hashed_password):
+        if not await self.hash_service.verify(password, hashed_password):
             raise BadRequestException("Invalid credentials")
 
         token_payload = self._create_user_payload(user)
@@ -47,11 +62,13 @@ class AuthUseCases:
         payload = self.jwt_service.verify_refresh_token(refresh_token)
         if not payload:
             raise BadRequestException("Invalid refresh token")
-        user = await self.userRepo.find_one_by_filter({"id": payload["user"]["id"]})
+        user, hashed_refresh_token = await self.userRepo.find_one_with_secret(
+            {"id": payload["user"]["id"]}, "hashed_refresh_token"
+        )
         if not user:
             raise NotFoundException("User not found")
-        is_refresh_token_valid = self.hash_service.verify(
-            refresh_token, user.hashed_refresh_token
+        is_refresh_token_valid = await self.token_digest_service.verify(
+            refresh_token, hashed_refresh_token
         )
         if not is_refresh_token_valid:
             raise BadRequestException("Invalid refresh token")
@@ -65,8 +82,9 @@ class AuthUseCases:
             "cookie": self._create_cookie_with_refresh_token(new_refresh_token),
         }
 
-    async def logout(self, userId: str) -> dict:
+    async def logout(self, userId: str, access_token_payload: dict) -> dict:
         await self._remove_user_refresh_token(userId)
+        await self.token_revocation_service.revoke(access_token_payload)
         cookie = {
             "key": "refresh_token",
             "value": "",
@@ -83,21 +101,28 @@ class AuthUseCases:
         }
 
     async def register(self, body: RegisterDto):
-        existing_user = await self.userRepo.find_one_by_filter({"email": body.email})
-        if existing_user:
-            raise BadRequestException("Email already in use")
-        hashed_password = self.hash_service.hash(body.password)
+        # Everything the row needs, refresh token digest included, is computed
+        # up front so the signup is a single INSERT; the unique index on
+        # email rejects duplicates instead of a prior SELECT.
         user_data = {
+            "id": new_id(),
             "email": body.email,
             "full_name": body.full_name,
-            "hashed_password": hashed_password,
+            "avatar_url": None,
+            "hashed_password": await self.hash_service.hash(body.password),
             "is_active": True,
             "is_admin": False,
         }
-        user = await self.userRepo.create(user_data)
-        token_payload = self._create_user_payload(user)
+        token_payload = {"user": {k: user_data[k] for k in USER_CLAIMS}}
         access_token = self.jwt_service.generate_access_token(token_payload)
-        refresh_token = await self._gen_user_refresh_token(token_payload)
+        refresh_token = self.jwt_service.generate_refresh_token(token_payload)
+        user_data["hashed_refresh_token"] = await self.token_digest_service.digest(
+            refresh_token
+        )
+        try:
+            await self.userRepo.create(user_data)
+        except IntegrityError:
+            raise BadRequestException("Email already in use")
         cookie = self._create_cookie_with_refresh_token(refresh_token)
         return {
             "response": {
@@ -107,26 +132,19 @@ class AuthUseCases:
         }
 
     async def _remove_user_refresh_token(self, userId: str) -> None:
-        await self.userRepo.update(userId, {"hashed_refresh_token": None})
+        await self.userRepo.update_fields(userId, {"hashed_refresh_token": None})
 
     async def _gen_user_refresh_token(self, payload: dict) -> None:
         refresh_token = self.jwt_service.generate_refresh_token(payload)
-        await self.userRepo.update(
+        hashed_refresh_token = await self.token_digest_service.digest(refresh_token)
+        await self.userRepo.update_fields(
             payload["user"]["id"],
-            {"hashed_refresh_token": self.hash_service.hash(refresh_token)},
+            {"hashed_refresh_token": hashed_refresh_token},
         )
         return refresh_token
 
     def _create_user_payload(self, user: UserEntity) -> dict:
-        return {
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "full_name": user.full_name,
-                "avatar_url": user.avatar_url,
-                "is_admin": user.is_admin,
-            }
-        }
+        return {"user": {k: getattr(user, k) for k in USER_CLAIMS}}
 
     def _create_cookie_with_refresh_token(self, refresh_token: str) -> dict:
         return {
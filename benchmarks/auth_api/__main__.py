@@ -0,0 +1,100 @@
+"""In-process HTTP load test of the auth API.
+
+Boots ``create_app()`` against a temporary SQLite file (aiosqlite) unless
+``--database-url`` is given, and drives
+login, register, refresh-token, is-authenticated and logout through the full
+middleware stack, one scenario after another.
+
+    python -m benchmarks.auth_api --concurrency 16 --requests 400 \\
+        --output auth_api.json
+"""
+
+import argparse
+import asyncio
+import os
+import platform
+import tempfile
+
+import httpx
+
+from benchmarks.auth_api.harness import boot_app, seed_users
+from benchmarks.auth_api.scenarios import SCENARIOS, VirtualUser, run_scenario
+from benchmarks.common import git_revision, write_json
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.database_url is None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "auth_api.db")
+            args.database_url = f"sqlite+aiosqlite:///{path}"
+            await run(args)
+    else:
+        await run(args)
+
+
+async def run(args: argparse.Namespace) -> None:
+    app, engine = await boot_app(args.database_url)
+    emails = await seed_users(args.concurrency)
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            users = [VirtualUser(client, email) for email in emails]
+            for user in users:
+                await user.login()
+            for name in args.scenarios:
+                result = await run_scenario(
+                    name, users, args.requests, warmup=args.warmup
+                )
+                results[name] = result
+                latency = result["latency"]
+                print(
+                    f"{name:>16}: {result['req_per_sec']:>9} req/s  "
+                    f"p50={latency['p50_ms']}ms p95={latency['p95_ms']}ms "
+                    f"p99={latency['p99_ms']}ms errors={result['errors']}"
+                )
+    finally:
+        await engine.dispose()
+
+    if args.output:
+        write_json(
+            args.output,
+            {
+                "benchmark": "auth_api",
+                "revision": git_revision(),
+                "python": platform.python_version(),
+                "config": {
+                    "concurrency": args.concurrency,
+                    "requests": args.requests,
+                    "warmup": args.warmup,
+                    "database": engine.url.render_as_string(hide_password=True),
+                },
+                "results": results,
+            },
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--requests", type=int, default=400, help="Measured requests per scenario"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=2, help="Unmeasured requests per client"
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+    )
+    parser.add_argument(
+        "--database-url", help="Async SQLAlchemy URL (default: temporary SQLite file)"
+    )
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,74 @@
+import os
+import sys
+import uuid
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "app"))
+
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+
+from app.infrastructure.configs import db_config  # noqa: E402
+from app.infrastructure.entities.user_entity import UserEntity  # noqa: E402
+from app.infrastructure.repositories.base_crud_repository import (  # noqa: E402
+    BaseCrudRepository,
+)
+from app.infrastructure.services.hash_service import bcrypt_hash  # noqa: E402
+
+PASSWORD = "BenchPass123!"
+
+
+def _engine_for(database_url: str) -> AsyncEngine:
+    if not database_url.startswith("sqlite"):
+        return create_async_engine(database_url)
+    # A file database, not :memory:, so every session gets its own connection
+    # and concurrent transactions stay isolated.
+    engine = create_async_engine(
+        database_url, pool_size=32, connect_args={"timeout": 30}
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _wal(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return engine
+
+
+async def boot_app(database_url: str) -> Tuple[FastAPI, AsyncEngine]:
+    """Build the real application from ``create_app()`` on top of
+    ``database_url``, with an empty schema."""
+    engine = _engine_for(database_url)
+    db_config.AsyncSessionLocal.configure(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(db_config.Base.metadata.drop_all)
+        await conn.run_sync(db_config.Base.metadata.create_all)
+
+    from app.infrastructure.configs.app_config import app_settings
+    from app.main import create_app
+
+    # Every virtual user shares one client address; the benchmark measures
+    # capacity, not the brute-force budgets.
+    app_settings.throttle_enabled = False
+
+    return create_app(), engine
+
+
+async def seed_users(count: int) -> List[str]:
+    """Insert ``count`` users sharing one password and return their emails."""
+    hashed = bcrypt_hash(PASSWORD)
+    run = uuid.uuid4().hex[:8]
+    emails = [f"bench-{run}-{i}@bench.aicademy.com" for i in range(count)]
+    await BaseCrudRepository(UserEntity).bulk_create(
+        {
+            "id": str(uuid.uuid4()),
+            "email": email,
+            "full_name": "Bench User",
+            "hashed_password": hashed,
+        }
+        for email in emails
+    )
+    return emails
@@ -0,0 +1,129 @@
+import asyncio
+import time
+import uuid
+from collections import Counter
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+from jose import jwt
+
+from app.infrastructure.services.jwt_service import JWTService
+
+from benchmarks.auth_api.harness import PASSWORD
+from benchmarks.common import summarize_latencies
+
+API = "/api/v1/auth"
+
+
+class VirtualUser:
+    """One concurrent client. Each owns a distinct account, so rotating its
+    refresh token never races with another client."""
+
+    def __init__(self, client: httpx.AsyncClient, email: str):
+        self.client = client
+        self.email = email
+        self.access_token = ""
+        self.refresh_token = ""
+
+    def _remember(self, response: httpx.Response) -> None:
+        if response.status_code != 200:
+            return
+        self.access_token = response.json()["data"]["access_token"]
+        cookie = response.headers.get("set-cookie", "")
+        if cookie.startswith("refresh_token="):
+            self.refresh_token = cookie.split(";", 1)[0].split("=", 1)[1]
+
+    def _bearer(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    async def login(self) -> httpx.Response:
+        response = await self.client.post(
+            f"{API}/login", json={"email": self.email, "password": PASSWORD}
+        )
+        self._remember(response)
+        return response
+
+    async def register(self) -> httpx.Response:
+        return await self.client.post(
+            f"{API}/register",
+            json={
+                "email": f"new-{uuid.uuid4().hex}@bench.aicademy.com",
+                "full_name": "Bench Register",
+                "password": PASSWORD,
+            },
+        )
+
+    async def refresh_token(self) -> httpx.Response:
+        # The cookie is marked Secure, so send it by hand over plain http.
+        response = await self.client.post(
+            f"{API}/refresh-token",
+            headers={"cookie": f"refresh_token={self.refresh_token}"},
+        )
+        self._remember(response)
+        return response
+
+    async def is_authenticated(self) -> httpx.Response:
+        return await self.client.get(f"{API}/is-authenticated", headers=self._bearer())
+
+    async def reissue_access_token(self) -> None:
+        # Logout revokes the access token it was called with, so each timed
+        # logout needs a fresh one; minting it locally keeps bcrypt out of it.
+        claims = jwt.get_unverified_claims(self.access_token)
+        self.access_token = JWTService().generate_access_token({"user": claims["user"]})
+
+    async def logout(self) -> httpx.Response:
+        return await self.client.delete(f"{API}/logout", headers=self._bearer())
+
+
+# Run in this order: later scenarios reuse the tokens obtained by earlier ones.
+SCENARIOS: Dict[str, Callable[[VirtualUser], Awaitable[httpx.Response]]] = {
+    "login": VirtualUser.login,
+    "register": VirtualUser.register,
+    "refresh_token": VirtualUser.refresh_token,
+    "is_authenticated": VirtualUser.is_authenticated,
+    "logout": VirtualUser.logout,
+}
+
+# Untimed steps run before every call of a scenario.
+PREPARE: Dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "logout": VirtualUser.reissue_access_token,
+}
+
+
+async def run_scenario(
+    name: str, users: List[VirtualUser], requests: int, warmup: int = 0
+) -> dict:
+    """Spread ``requests`` calls across ``users``, one in flight per user."""
+    call = SCENARIOS[name]
+    prepare = PREPARE.get(name)
+    latencies_ms: List[float] = []
+    statuses: Counter = Counter()
+    per_user = [requests // len(users)] * len(users)
+    for i in range(requests % len(users)):
+        per_user[i] += 1
+
+    async def drive(user: VirtualUser, count: int) -> None:
+        for _ in range(warmup):
+            if prepare is not None:
+                await prepare(user)
+            await call(user)
+        for _ in range(count):
+            if prepare is not None:
+                await prepare(user)
+            start = time.perf_counter()
+            response = await call(user)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(drive(u, n) for u, n in zip(users, per_user)))
+    elapsed = time.perf_counter() - start
+
+    ok = sum(n for status, n in statuses.items() if 200 <= status < 300)
+    return {
+        "requests": requests,
+        "errors": requests - ok,
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "req_per_sec": round(requests / elapsed, 2) if elapsed else 0.0,
+        "latency": summarize_latencies(latencies_ms),
+    }
@@ -0,0 +1,106 @@
+"""Per-call Python overhead of the login lookup, ``find_one_by_filter({"email"})``.
+
+Compares building the SELECT on every call (the previous behaviour) with the
+cached statement template from ``statement_cache``. The query runs on an
+in-memory SQLite database through a sync session, so driver and network time
+stay out of the numbers.
+
+    python -m benchmarks.filter_statement_bench --calls 20000
+"""
+
+import argparse
+import time
+import uuid
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.configs.db_config import Base
+from app.infrastructure.entities.user_entity import UserEntity
+from app.infrastructure.repositories.statement_cache import (
+    filter_statement,
+    statement_cache_info,
+)
+from benchmarks.common import write_json
+
+USERS = 1000
+
+
+def legacy_statement(filter_):
+    q = select(UserEntity)
+    for k, v in filter_.items():
+        q = q.where(getattr(UserEntity, k) == v)
+    return q, {}
+
+
+def cached_statement(filter_):
+    return filter_statement(UserEntity, filter_)
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return round((time.perf_counter() - start) / calls * 1e6, 2)
+
+
+def main(args: argparse.Namespace) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(UserEntity.__table__),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "email": f"user{i}@aicademy.com",
+                    "full_name": f"User {i}",
+                    "hashed_password": "x",
+                }
+                for i in range(USERS)
+            ],
+        )
+
+    emails = [f"user{i}@aicademy.com" for i in range(USERS)]
+    results = {}
+    with Session(engine) as session:
+        for name, build in (("legacy", legacy_statement), ("cached", cached_statement)):
+
+            def build_only(i):
+                build({"email": emails[i % USERS]})
+
+            def lookup(i):
+                q, params = build({"email": emails[i % USERS]})
+                session.execute(q, params).scalars().first()
+                session.expunge_all()
+
+            lookup(0)
+            results[name] = {
+                "build_us": per_call_us(build_only, args.calls),
+                "lookup_us": per_call_us(lookup, args.calls),
+            }
+            print(
+                f"{name:>6}: build={results[name]['build_us']}us "
+                f"build+execute={results[name]['lookup_us']}us"
+            )
+    engine.dispose()
+
+    cache = statement_cache_info()
+    print(f"statement cache: {cache}")
+    if args.output:
+        write_json(
+            args.output,
+            {
+                "benchmark": "filter_statement",
+                "calls": args.calls,
+                "results": results,
+                "statement_cache": cache,
+            },
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    main(parser.parse_args())
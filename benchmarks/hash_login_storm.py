@@ -0,0 +1,112 @@
+"""Latency of an unrelated endpoint while a burst of logins runs bcrypt.
+
+Compares the old behaviour (bcrypt called inline on the event loop) with the
+bounded worker pool used by ``HashService``.
+
+    python -m benchmarks.hash_login_storm --logins 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.infrastructure.services.hash_service import (
+    HashService,
+    HashWorkerPool,
+    bcrypt_hash,
+    bcrypt_verify,
+)
+from benchmarks.common import summarize_latencies, write_json
+
+PASSWORD = "UserPass123!"
+
+
+def build_app(mode: str, pool: HashWorkerPool) -> FastAPI:
+    app = FastAPI()
+    hashed = bcrypt_hash(PASSWORD)
+    hash_service = HashService(pool)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/login")
+    async def login():
+        if mode == "inline":
+            ok = bcrypt_verify(PASSWORD, hashed)
+        else:
+            ok = await hash_service.verify(PASSWORD, hashed)
+        return {"ok": ok}
+
+    return app
+
+
+async def run_mode(mode: str, args: argparse.Namespace) -> dict:
+    pool = HashWorkerPool(
+        kind=args.executor,
+        max_workers=args.workers,
+        max_pending=args.logins,
+    )
+    app = build_app(mode, pool)
+    transport = httpx.ASGITransport(app=app)
+    ping_latencies = []
+    storm_done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one_login():
+            async with semaphore:
+                await c.post("/login")
+
+        async def storm():
+            await asyncio.gather(*(one_login() for _ in range(args.logins)))
+            storm_done.set()
+
+        async def prober():
+            # Latency is measured from the intended send time, so time spent
+            # waiting for a blocked loop is counted instead of hidden.
+            intended = time.perf_counter()
+            while not storm_done.is_set():
+                await asyncio.sleep(max(0.0, intended - time.perf_counter()))
+                await c.get("/ping")
+                ping_latencies.append((time.perf_counter() - intended) * 1000)
+                intended += args.probe_interval
+
+        started = time.perf_counter()
+        await asyncio.gather(storm(), prober())
+        elapsed = time.perf_counter() - started
+
+    pool.shutdown()
+    return {
+        "mode": mode,
+        "logins_per_sec": round(args.logins / elapsed, 2),
+        "ping": summarize_latencies(ping_latencies),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = [await run_mode(mode, args) for mode in ("inline", "pool")]
+    for result in results:
+        ping = result["ping"]
+        print(
+            f"{result['mode']:>6}: logins/s={result['logins_per_sec']:<8} "
+            f"ping p50={ping['p50_ms']}ms p99={ping['p99_ms']}ms "
+            f"max={ping['max_ms']}ms (n={ping['count']})"
+        )
+    if args.output:
+        write_json(args.output, {"benchmark": "hash_login_storm", "results": results})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--probe-interval", type=float, default=0.005)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    asyncio.run(main(parser.parse_args()))
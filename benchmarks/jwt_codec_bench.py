@@ -0,0 +1,75 @@
+"""Tokens/second for the JWT codecs in ``jwt_codec``.
+
+Their conformance across encoder/decoder pairs is covered by
+``tests/test_jwt_codec.py``.
+
+    python -m benchmarks.jwt_codec_bench --tokens 20000
+"""
+
+import argparse
+import time
+import uuid
+from typing import Callable, Dict
+
+from app.infrastructure.services.jwt_codec import JWT_CODECS
+from benchmarks.common import git_revision, write_json
+
+SECRET = "bench-secret"
+
+
+def claims(**overrides) -> dict:
+    now = int(time.time())
+    data = {
+        "user": {"id": str(uuid.uuid4()), "email": "bench@aicademy.com"},
+        "exp": now + 3600,
+        "iat": now,
+        "type": "access",
+        "jti": str(uuid.uuid4()),
+    }
+    data.update(overrides)
+    return data
+
+
+def tokens_per_sec(fn: Callable[[int], object], count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    return round(count / (time.perf_counter() - start), 1)
+
+
+def main(args: argparse.Namespace) -> None:
+    payloads = [claims() for _ in range(1000)]
+    results: Dict[str, Dict[str, float]] = {}
+    for name, cls in JWT_CODECS.items():
+        codec = cls(SECRET)
+        tokens = [codec.encode(p) for p in payloads]
+        results[name] = {
+            "encode_per_sec": tokens_per_sec(
+                lambda i: codec.encode(payloads[i % 1000]), args.tokens
+            ),
+            "decode_per_sec": tokens_per_sec(
+                lambda i: codec.decode(tokens[i % 1000]), args.tokens
+            ),
+        }
+        print(
+            f"{name:>6}: encode={results[name]['encode_per_sec']}/s "
+            f"decode={results[name]['decode_per_sec']}/s"
+        )
+
+    if args.output:
+        write_json(
+            args.output,
+            {
+                "benchmark": "jwt_codec",
+                "revision": git_revision(),
+                "tokens": args.tokens,
+                "results": results,
+            },
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=20000)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    main(parser.parse_args())
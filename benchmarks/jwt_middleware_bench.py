@@ -0,0 +1,108 @@
+"""Requests/second through the legacy and pure-ASGI JWT middleware stacks.
+
+Requests are driven straight into the ASGI app so the numbers reflect
+middleware and routing overhead rather than an HTTP client.
+
+    python -m benchmarks.jwt_middleware_bench --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.infrastructure.common.middlewares.jwt_middleware import (  # noqa: E402
+    DEFAULT_EXCLUDED_PATHS,
+    JWTMiddleware,
+)
+from app.infrastructure.services.jwt_service import JWTService  # noqa: E402
+from benchmarks.common import write_json  # noqa: E402
+
+
+class LegacyJWTMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation this benchmark compares against."""
+
+    def __init__(self, app, jwt_service=None, excluded_paths=None):
+        super().__init__(app)
+        self.jwt_service = jwt_service or JWTService()
+        self.excluded_paths = excluded_paths or list(DEFAULT_EXCLUDED_PATHS)
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in self.excluded_paths:
+            return await call_next(request)
+        auth_header = request.headers.get("Authorization")
+        token = auth_header.split(" ")[1]
+        payload = self.jwt_service.verify_access_token(token)
+        request.state.user = payload.get("user")
+        return await call_next(request)
+
+
+def build_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/auth/is-authenticated")
+    async def is_authenticated(request: Request):
+        return request.state.user
+
+    app.add_middleware(middleware_class)
+    return app
+
+
+async def drive(app, token: str, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/auth/is-authenticated",
+        "raw_path": b"/api/v1/auth/is-authenticated",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - start)
+
+
+async def main(args: argparse.Namespace) -> None:
+    token = JWTService().generate_access_token(
+        {"user": {"id": "bench-user", "email": "bench@aicademy.local"}}
+    )
+    results = {}
+    for name, middleware_class in (
+        ("legacy", LegacyJWTMiddleware),
+        ("asgi", JWTMiddleware),
+    ):
+        app = build_app(middleware_class)
+        await drive(app, token, min(args.requests, 1000))
+        results[name] = round(await drive(app, token, args.requests), 1)
+        print(f"{name:>6}: {results[name]} req/s")
+    print(f"speedup: {results['asgi'] / results['legacy']:.2f}x")
+    if args.output:
+        write_json(args.output, {"benchmark": "jwt_middleware", "req_per_sec": results})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,126 @@
+"""Latency of OFFSET pagination vs keyset pagination at shallow and deep pages.
+
+Runs against a temporary SQLite database (aiosqlite), filled with synthetic
+users.
+
+    python -m benchmarks.keyset_pagination_bench --rows 200000 --deep-page 10000
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.configs.db_config import Base
+from app.infrastructure.entities.user_entity import UserEntity
+from app.infrastructure.repositories.base_crud_repository import BaseCrudRepository
+from app.infrastructure.repositories.keyset import encode_cursor
+from benchmarks.common import write_json
+
+
+def fill(path: str, rows: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    start = datetime.datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, rows, 10000):
+            conn.execute(
+                insert(UserEntity.__table__),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "email": f"user{i}@bench.local",
+                        "full_name": f"User {i}",
+                        "hashed_password": "x",
+                        "is_active": True,
+                        "is_admin": False,
+                        "created_at": start + datetime.timedelta(seconds=i),
+                        "updated_at": start + datetime.timedelta(seconds=i),
+                    }
+                    for i in range(offset, min(offset + 10000, rows))
+                ],
+            )
+    engine.dispose()
+
+
+async def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        fill(path, args.rows)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        sessions = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        repo = BaseCrudRepository(UserEntity)
+        order = (UserEntity.created_at.asc(), UserEntity.id.asc())
+
+        def query(_db):
+            return select(UserEntity).order_by(*order)
+
+        async with sessions() as db:
+            boundary = (
+                await db.execute(
+                    select(UserEntity)
+                    .order_by(*order)
+                    .offset((args.deep_page - 1) * args.per_page - 1)
+                    .limit(1)
+                )
+            ).scalar_one()
+        deep_cursor = encode_cursor([boundary.created_at, boundary.id])
+
+        results = {}
+        for label, page, cursor in (
+            ("page_1", 1, None),
+            (f"page_{args.deep_page}", args.deep_page, deep_cursor),
+        ):
+            async with sessions() as db:
+
+                async def offset_page():
+                    await repo.paginate(query, page, args.per_page, session=db)
+
+                async def keyset_page():
+                    await repo.paginate_keyset(
+                        limit=args.per_page, cursor=cursor, session=db
+                    )
+
+                results[label] = {
+                    "offset_ms": await timed(offset_page, args.repeat),
+                    "keyset_ms": await timed(keyset_page, args.repeat),
+                }
+            print(
+                f"{label:>12}: offset={results[label]['offset_ms']}ms "
+                f"keyset={results[label]['keyset_ms']}ms"
+            )
+        await engine.dispose()
+
+    if args.output:
+        write_json(
+            args.output,
+            {"benchmark": "keyset_pagination", "rows": args.rows, "results": results},
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--deep-page", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,169 @@
+"""Registrations per second: pre-check + insert + update vs a single insert.
+
+Drives ``AuthUseCases.register`` inside the same unit of work the API uses,
+against a temporary SQLite file (aiosqlite) unless ``--database-url`` is
+given. bcrypt is swapped for a SHA-256 hash by default so the numbers show
+the database round trips; pass ``--bcrypt`` to include it.
+
+    python -m benchmarks.register_bench --registrations 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+import uuid
+from typing import List
+
+# Imported first: the harness puts app/ on sys.path for the DTO imports.
+from benchmarks.auth_api.harness import PASSWORD, boot_app
+from app.domain.adapters.hashing import IHashService
+from app.infrastructure.common.exceptions.http_exceptions import BadRequestException
+from app.infrastructure.controllers.auth.dto.register_dto import RegisterDto
+from app.infrastructure.repositories.unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.repositories.revoked_token_repository import (
+    RevokedTokenRepository,
+)
+from app.infrastructure.services.hash_service import HashService
+from app.infrastructure.services.jwt_service import JWTService
+from app.infrastructure.services.token_digest_service import TokenDigestService
+from app.infrastructure.services.token_revocation_service import (
+    TokenRevocationService,
+)
+from app.usecases.auth.auth_use_cases import AuthUseCases
+from benchmarks.common import git_revision, summarize_latencies, write_json
+
+
+class Sha256Hash(IHashService):
+    async def hash(self, plain_text: str) -> str:
+        return hashlib.sha256(plain_text.encode()).hexdigest()
+
+    async def verify(self, plain_text: str, hashed_text: str) -> bool:
+        return await self.hash(plain_text) == hashed_text
+
+
+class LegacyAuthUseCases(AuthUseCases):
+    """The register flow before the single-insert change."""
+
+    async def register(self, body: RegisterDto):
+        existing_user = await self.userRepo.find_one_by_filter({"email": body.email})
+        if existing_user:
+            raise BadRequestException("Email already in use")
+        hashed_password = await self.hash_service.hash(body.password)
+        user = await self.userRepo.create(
+            {
+                "email": body.email,
+                "full_name": body.full_name,
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "is_admin": False,
+            }
+        )
+        token_payload = self._create_user_payload(user)
+        access_token = self.jwt_service.generate_access_token(token_payload)
+        refresh_token = await self._gen_user_refresh_token(token_payload)
+        return {
+            "response": {"access_token": access_token},
+            "cookie": self._create_cookie_with_refresh_token(refresh_token),
+        }
+
+
+FLOWS = {"legacy": LegacyAuthUseCases, "single_insert": AuthUseCases}
+
+
+async def register_one(flow: str, hash_service: IHashService, email: str) -> None:
+    async with SqlAlchemyUnitOfWork() as uow:
+        use_cases = FLOWS[flow](
+            UserRepository(uow.session),
+            JWTService(),
+            hash_service,
+            TokenDigestService(hash_service),
+            TokenRevocationService(RevokedTokenRepository(uow.session)),
+        )
+        await use_cases.register(
+            RegisterDto(email=email, full_name="Bench Register", password=PASSWORD)
+        )
+
+
+async def run_flow(flow: str, args: argparse.Namespace, hash_service) -> dict:
+    run = uuid.uuid4().hex[:8]
+    emails = [f"{flow}-{run}-{i}@bench.aicademy.com" for i in range(args.registrations)]
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    for email in emails:
+        queue.put_nowait(email)
+    latencies_ms: List[float] = []
+
+    async def worker() -> None:
+        while not queue.empty():
+            email = queue.get_nowait()
+            start = time.perf_counter()
+            await register_one(flow, hash_service, email)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    # One duplicate, to show it is rejected by each flow.
+    try:
+        await register_one(flow, hash_service, emails[0])
+        duplicate = "accepted"
+    except BadRequestException as exc:
+        duplicate = f"rejected ({exc.detail})"
+    return {
+        "registrations_per_sec": round(args.registrations / elapsed, 1),
+        "latency": summarize_latencies(latencies_ms),
+        "duplicate": duplicate,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.database_url is None:
+        with tempfile.TemporaryDirectory() as tmp:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'reg.db')}"
+            await run(args)
+    else:
+        await run(args)
+
+
+async def run(args: argparse.Namespace) -> None:
+    _, engine = await boot_app(args.database_url)
+    hash_service = HashService() if args.bcrypt else Sha256Hash()
+    results = {}
+    try:
+        for flow in FLOWS:
+            results[flow] = await run_flow(flow, args, hash_service)
+            latency = results[flow]["latency"]
+            print(
+                f"{flow:>13}: {results[flow]['registrations_per_sec']:>8} reg/s  "
+                f"p50={latency['p50_ms']}ms p95={latency['p95_ms']}ms  "
+                f"duplicate {results[flow]['duplicate']}"
+            )
+    finally:
+        await engine.dispose()
+
+    if args.output:
+        write_json(
+            args.output,
+            {
+                "benchmark": "register",
+                "revision": git_revision(),
+                "registrations": args.registrations,
+                "concurrency": args.concurrency,
+                "bcrypt": args.bcrypt,
+                "results": results,
+            },
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--registrations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--bcrypt", action="store_true", help="Hash with bcrypt")
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    asyncio.run(main(parser.parse_args()))
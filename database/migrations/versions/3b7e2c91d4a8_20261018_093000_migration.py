@@ -0,0 +1,61 @@
+"""20261018_093000_migration
+
+Store refresh tokens as keyed HMAC-SHA256 digests.
+
+No data is rewritten on upgrade: existing bcrypt digests stay valid and are
+replaced by an ``hmac-sha256$<hex>`` digest the next time each user's refresh
+token rotates. Downgrading clears HMAC digests because bcrypt-only code cannot
+verify them, which forces those users to log in again.
+
+Revision ID: 3b7e2c91d4a8
+Revises: f85b79eec602
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2c91d4a8'
+down_revision: Union[str, Sequence[str], None] = 'f85b79eec602'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _supports_comments() -> bool:
+    # SQLite has no column comments; there is nothing to alter.
+    return op.get_bind().dialect.supports_comments
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _supports_comments():
+        return
+    op.alter_column(
+        'users',
+        'hashed_refresh_token',
+        existing_type=sa.String(length=255),
+        existing_nullable=True,
+        comment='hmac-sha256$<hex> digest, or a legacy bcrypt hash',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "UPDATE users SET hashed_refresh_token = NULL "
+        "WHERE hashed_refresh_token LIKE 'hmac-sha256$%'"
+    )
+    if not _supports_comments():
+        return
+    op.alter_column(
+        'users',
+        'hashed_refresh_token',
+        existing_type=sa.String(length=255),
+        existing_nullable=True,
+        comment=None,
+        existing_comment='hmac-sha256$<hex> digest, or a legacy bcrypt hash',
+    )
@@ -0,0 +1,170 @@
+"""20261018_130000_migration
+
+Drop the index duplicating the users primary key and, when
+DATABASE_BINARY_UUID is set, store users.id as a 16-byte UUID.
+
+The conversion runs when DATABASE_BINARY_UUID is set in the environment of
+the migration and users.id is still a string; downgrade converts back
+whenever users.id is binary. On MySQL it is done online: a BINARY(16) shadow
+column is added, kept in sync with a trigger and backfilled in batches while
+the application keeps serving, then swapped in with one in-place ALTER.
+Application instances still on string ids cannot insert users after the
+swap, so restart them with DATABASE_BINARY_UUID=true right after it
+completes.
+
+Revision ID: 7e4a1d9c2b65
+Revises: 5c1f8e27ab90
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.configs.app_config import app_settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e4a1d9c2b65'
+down_revision: Union[str, Sequence[str], None] = '5c1f8e27ab90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 10000
+
+UUID_TO_BIN = "UNHEX(REPLACE({}, '-', ''))"
+BIN_TO_UUID = (
+    "LOWER(CONCAT_WS('-', HEX(SUBSTR({0}, 1, 4)), HEX(SUBSTR({0}, 5, 2)), "
+    'HEX(SUBSTR({0}, 7, 2)), HEX(SUBSTR({0}, 9, 2)), HEX(SUBSTR({0}, 11, 6))))'
+)
+
+
+def _id_is_binary() -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns('users')
+    id_type = next(c['type'] for c in columns if c['name'] == 'id')
+    try:
+        return id_type.python_type in (bytes, uuid.UUID)
+    except NotImplementedError:
+        return False
+
+
+def _indexes_on_id() -> list:
+    """Secondary indexes that include users.id, e.g. the keyset index."""
+    return [
+        index
+        for index in sa.inspect(op.get_bind()).get_indexes('users')
+        if 'id' in index['column_names']
+    ]
+
+
+def _backfill(sql: str) -> None:
+    bind = op.get_bind()
+    while bind.execute(sa.text(sql)).rowcount:
+        pass
+
+
+def _mysql_swap_id(shadow: str, column_type: str, convert: str) -> None:
+    """Replace users.id by ``shadow`` of ``column_type``, filled with
+    ``convert`` (a template applied to the source column) without blocking
+    writes."""
+    op.execute(
+        f'ALTER TABLE users ADD COLUMN {shadow} {column_type} NULL, '
+        'ALGORITHM=INPLACE, LOCK=NONE'
+    )
+    # Rows written during the backfill get the shadow value from the
+    # triggers, so none is left NULL when the column becomes the key.
+    for event in ('INSERT', 'UPDATE'):
+        op.execute(
+            f'CREATE TRIGGER users_{shadow}_{event.lower()} BEFORE {event} '
+            f'ON users FOR EACH ROW SET NEW.{shadow} = '
+            + convert.format('NEW.id')
+        )
+    _backfill(
+        f'UPDATE users SET {shadow} = {convert.format("id")} '
+        f'WHERE {shadow} IS NULL LIMIT {BACKFILL_BATCH}'
+    )
+    # Indexes on id are rebuilt in the same statement; MySQL would otherwise
+    # just drop id from them.
+    indexes = _indexes_on_id()
+    drop_indexes = ''.join(f'DROP INDEX {i["name"]}, ' for i in indexes)
+    add_indexes = ''.join(
+        ', ADD {}INDEX {} ({})'.format(
+            'UNIQUE ' if i['unique'] else '', i['name'], ', '.join(i['column_names'])
+        )
+        for i in indexes
+    )
+    op.execute(
+        f'ALTER TABLE users {drop_indexes}DROP PRIMARY KEY, DROP COLUMN id, '
+        f'CHANGE COLUMN {shadow} id {column_type} NOT NULL FIRST, '
+        f'ADD PRIMARY KEY (id){add_indexes}, ALGORITHM=INPLACE, LOCK=NONE'
+    )
+    # The triggers stay through the swap so rows written while it runs are
+    # converted too; until they are dropped, inserts from instances on the
+    # old id type fail, which they would after the swap anyway.
+    for event in ('insert', 'update'):
+        op.execute(f'DROP TRIGGER users_{shadow}_{event}')
+
+
+def _sqlite_swap_id(shadow: sa.Column, convert) -> None:
+    """Rebuild users with ``shadow`` as its id, filled with ``convert(id)``."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(shadow)
+    bind = op.get_bind()
+    for (id_,) in bind.execute(sa.text('SELECT id FROM users')).all():
+        bind.execute(
+            sa.text(f'UPDATE users SET {shadow.name} = :v WHERE id = :id'),
+            {'v': convert(id_), 'id': id_},
+        )
+    indexes = _indexes_on_id()
+    for index in indexes:
+        op.drop_index(index['name'], table_name='users')
+    # Each step in its own rebuild: dropping id and renaming the shadow
+    # column onto it in one batch collides on the name.
+    with op.batch_alter_table('users', recreate='always') as batch_op:
+        batch_op.drop_column('id')
+    with op.batch_alter_table('users', recreate='always') as batch_op:
+        batch_op.alter_column(shadow.name, new_column_name='id', nullable=False)
+    with op.batch_alter_table('users', recreate='always') as batch_op:
+        batch_op.create_primary_key('pk_users', ['id'])
+    for index in indexes:
+        op.create_index(
+            index['name'], 'users', index['column_names'], unique=index['unique']
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    if not app_settings.database_binary_uuid or _id_is_binary():
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        _mysql_swap_id('id_bin', 'BINARY(16)', UUID_TO_BIN)
+    elif dialect == 'postgresql':
+        op.execute('ALTER TABLE users ALTER COLUMN id TYPE uuid USING id::uuid')
+    else:
+        _sqlite_swap_id(
+            sa.Column('id_bin', sa.LargeBinary(16)),
+            lambda id_: uuid.UUID(id_).bytes,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _id_is_binary():
+        dialect = op.get_bind().dialect.name
+        if dialect == 'mysql':
+            _mysql_swap_id('id_str', 'VARCHAR(36)', BIN_TO_UUID)
+        elif dialect == 'postgresql':
+            op.execute(
+                'ALTER TABLE users ALTER COLUMN id TYPE varchar(36) USING id::text'
+            )
+        else:
+            _sqlite_swap_id(
+                sa.Column('id_str', sa.String(length=36)),
+                lambda id_: str(uuid.UUID(bytes=id_)),
+            )
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
@@ -0,0 +1,31 @@
+"""20261018_101500_migration
+
+Composite (created_at, id) index used by keyset pagination.
+
+Revision ID: 9d41c6a2e5f3
+Revises: 3b7e2c91d4a8
+Create Date: 2026-10-18 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d41c6a2e5f3'
+down_revision: Union[str, Sequence[str], None] = '3b7e2c91d4a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at_id', table_name='users')
@@ -1,9 +1,16 @@
-import uuid
-from typing import List, Dict
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
 
-from app.infrastructure.configs.db_config import sync_engine, SyncSessionLocal, Base
+from sqlalchemy import insert
+
+from app.infrastructure.configs.db_config import get_sync_engine, SyncSessionLocal, Base
+from app.infrastructure.entities.id_types import UUID7Generator, new_id
 from app.infrastructure.entities.user_entity import UserEntity
-from app.infrastructure.services.hash_service import HashService
+from app.infrastructure.services.hash_service import bcrypt_hash
 
 
 def get_seed_users() -> List[Dict]:
@@ -76,25 +83,25 @@ def seed_users():
     """Create tables (if needed) and insert seed users idempotently."""
 
     # Ensure tables exist
+    sync_engine = get_sync_engine()
     Base.metadata.create_all(bind=sync_engine)
 
-    db = SyncSessionLocal()
+    db = SyncSessionLocal(bind=sync_engine)
     try:
         # If there is already data, skip seeding completely
         if db.query(UserEntity).first():
             print("Users table already has data, skipping seeding.")
             return
 
-        hash_service = HashService()
         users = get_seed_users()
         created = 0
 
         for u in users:
             user = UserEntity(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 email=u["email"],
                 full_name=u["full_name"],
-                hashed_password=hash_service.hash(u["password"]),
+                hashed_password=bcrypt_hash(u["password"]),
                 is_active=True,
                 is_admin=u.get("is_admin", False),
             )
@@ -110,5 +117,116 @@ def seed_users():
         db.close()
 
 
+SYNTHETIC_PASSWORD = "SeedPass123!"
+SYNTHETIC_EPOCH_MS = 1735689600000  # 2025-01-01T00:00:00Z
+
+
+def generate_users(count: int, seed: int, unique_passwords: bool) -> Iterator[Dict]:
+    """Yield ``count`` synthetic users; the same seed yields the same rows.
+
+    Ids are UUIDv7 from the application's generator, on a clock that starts
+    at ``SYNTHETIC_EPOCH_MS`` and ticks once per row, so they are as
+    time-ordered as production keys.
+    """
+    rng = random.Random(seed)
+    ticks = iter(range(SYNTHETIC_EPOCH_MS, SYNTHETIC_EPOCH_MS + count))
+    next_id = UUID7Generator(clock_ms=lambda: next(ticks), randbits=rng.getrandbits)
+    for i in range(count):
+        yield {
+            "id": str(next_id()),
+            "email": f"user{seed}-{i}@seed.aicademy.local",
+            "full_name": f"Seed User {i}",
+            "password": (
+                f"Seed-{rng.getrandbits(64):016x}"
+                if unique_passwords
+                else SYNTHETIC_PASSWORD
+            ),
+            "is_admin": False,
+        }
+
+
+def _chunks(rows: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def seed_synthetic_users(
+    count: int,
+    seed: int = 0,
+    chunk_size: int = 5000,
+    workers: Optional[int] = None,
+    unique_hashes: bool = False,
+) -> None:
+    """Stream generated users into the users table with bulk Core inserts.
+
+    By default every row shares one precomputed bcrypt hash of
+    ``SYNTHETIC_PASSWORD``; ``unique_hashes`` hashes a random password per
+    row across a process pool instead.
+    """
+    sync_engine = get_sync_engine()
+    Base.metadata.create_all(bind=sync_engine)
+
+    table = UserEntity.__table__
+    shared_hash = None if unique_hashes else bcrypt_hash(SYNTHETIC_PASSWORD)
+    pool = ProcessPoolExecutor(max_workers=workers) if unique_hashes else None
+    created = 0
+    start = time.perf_counter()
+    try:
+        for chunk in _chunks(generate_users(count, seed, unique_hashes), chunk_size):
+            passwords = [u.pop("password") for u in chunk]
+            if pool is not None:
+                hashes = pool.map(bcrypt_hash, passwords, chunksize=64)
+            else:
+                hashes = [shared_hash] * len(chunk)
+            for user, hashed in zip(chunk, hashes):
+                user["hashed_password"] = hashed
+                user["is_active"] = True
+
+            with sync_engine.begin() as conn:
+                conn.execute(insert(table), chunk)
+            created += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"  {created}/{count} users, {created / elapsed:.0f} rows/sec")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Seed complete. Created {created} users in {elapsed:.1f}s "
+        f"({created / elapsed if elapsed else 0:.0f} rows/sec)."
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Seed the users table.")
+    parser.add_argument(
+        "--count",
+        type=int,
+        help="Generate this many synthetic users instead of the fixed seed users",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument(
+        "--workers", type=int, help="Hashing processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--unique-hashes",
+        action="store_true",
+        help="Hash a distinct password per user instead of sharing one hash",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    seed_users()
+    args = parse_args()
+    if args.count:
+        seed_synthetic_users(
+            args.count,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            unique_hashes=args.unique_hashes,
+        )
+    else:
+        seed_users()
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Modules are imported both as ``app.…`` and, from inside app/, as
+# ``infrastructure.…``; make both roots importable as they are at runtime.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "app")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
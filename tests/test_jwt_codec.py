@@ -0,0 +1,118 @@
+"""Every JWT codec must accept what the others issue and reject the same bad
+tokens, so each case runs across every encoder/decoder pair."""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+import pytest
+
+from app.infrastructure.services.jwt_codec import (
+    JWT_CODECS,
+    InvalidTokenError,
+    TokenExpiredError,
+)
+
+SECRET = "test-secret"
+
+
+def claims(**overrides) -> dict:
+    now = int(time.time())
+    data = {
+        "user": {"id": str(uuid.uuid4()), "email": "test@aicademy.com"},
+        "exp": now + 3600,
+        "iat": now,
+        "type": "access",
+        "jti": str(uuid.uuid4()),
+    }
+    data.update(overrides)
+    return data
+
+
+def b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def forge(header: dict, payload: dict, secret: str = SECRET) -> str:
+    signing_input = (
+        b64(json.dumps(header).encode()) + "." + b64(json.dumps(payload).encode())
+    )
+    signature = hmac.new(
+        secret.encode(), signing_input.encode(), hashlib.sha256
+    ).digest()
+    return signing_input + "." + b64(signature)
+
+
+def tamper(token: str) -> str:
+    header, payload, signature = token.split(".")
+    body = json.loads(base64.urlsafe_b64decode(payload + "=="))
+    body["user"]["email"] = "admin@aicademy.com"
+    return ".".join((header, b64(json.dumps(body).encode()), signature))
+
+
+# (name, build token from an encoder, expected error or None for accepted)
+CASES = [
+    ("round trip", lambda enc: enc.encode(claims()), None),
+    (
+        "header with spaces and other key order",
+        lambda enc: forge({"typ": "JWT", "alg": "HS256"}, claims()),
+        None,
+    ),
+    (
+        "expired",
+        lambda enc: enc.encode(claims(exp=int(time.time()) - 10)),
+        TokenExpiredError,
+    ),
+    (
+        "not yet valid",
+        lambda enc: enc.encode(claims(nbf=int(time.time()) + 600)),
+        InvalidTokenError,
+    ),
+    (
+        "iat in the future",
+        lambda enc: enc.encode(claims(iat=int(time.time()) + 600)),
+        InvalidTokenError,
+    ),
+    (
+        "non-numeric exp",
+        lambda enc: enc.encode(claims(exp="tomorrow")),
+        InvalidTokenError,
+    ),
+    ("tampered payload", lambda enc: tamper(enc.encode(claims())), InvalidTokenError),
+    (
+        "wrong secret",
+        lambda enc: forge({"alg": "HS256", "typ": "JWT"}, claims(), "other"),
+        InvalidTokenError,
+    ),
+    (
+        "alg none",
+        lambda enc: forge({"alg": "none", "typ": "JWT"}, claims()).rsplit(".", 1)[0]
+        + ".",
+        InvalidTokenError,
+    ),
+    (
+        "alg HS512 header",
+        lambda enc: forge({"alg": "HS512", "typ": "JWT"}, claims()),
+        InvalidTokenError,
+    ),
+    ("two segments", lambda enc: "abc.def", InvalidTokenError),
+    ("garbage", lambda enc: "not a token", InvalidTokenError),
+]
+
+
+@pytest.mark.parametrize("decoder_name", sorted(JWT_CODECS))
+@pytest.mark.parametrize("encoder_name", sorted(JWT_CODECS))
+@pytest.mark.parametrize(
+    "build, expected", [case[1:] for case in CASES], ids=[case[0] for case in CASES]
+)
+def test_codec_conformance(encoder_name, decoder_name, build, expected):
+    token = build(JWT_CODECS[encoder_name](SECRET))
+    decoder = JWT_CODECS[decoder_name](SECRET)
+    if expected is None:
+        assert decoder.decode(token)["type"] == "access"
+    else:
+        with pytest.raises(expected):
+            decoder.decode(token)
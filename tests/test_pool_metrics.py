@@ -0,0 +1,40 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infrastructure.common.metrics.app_metrics import (
+    db_pool_checkout_seconds,
+    timed_pool_class,
+)
+
+
+def checkouts(name):
+    row = db_pool_checkout_seconds.values.get((name,))
+    return sum(row[:-1]) if row else 0
+
+
+def test_checkout_wait_is_timed_across_dispose(tmp_path):
+    async def run():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=timed_pool_class(AsyncAdaptedQueuePool, "timed"),
+            pool_size=1,
+            max_overflow=0,
+        )
+
+        async def hold(seconds):
+            async with engine.connect():
+                await asyncio.sleep(seconds)
+
+        try:
+            # The second checkout waits for the only connection.
+            await asyncio.gather(hold(0.2), hold(0))
+            await engine.dispose()
+            await hold(0)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+    assert checkouts("timed") == 3
+    assert db_pool_checkout_seconds.values[("timed",)][-1] >= 0.2
@@ -0,0 +1,28 @@
+from sqlalchemy import create_engine, literal, select
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.configs.routing_session import (
+    REPLICA_KEY,
+    ReplicaSet,
+    RoutingSession,
+)
+
+
+def sqlite_engine():
+    return create_engine("sqlite://", poolclass=QueuePool)
+
+
+def test_a_session_reads_from_one_replica():
+    primary = sqlite_engine()
+    replicas = [sqlite_engine(), sqlite_engine()]
+    replica_set = ReplicaSet(replicas, strategy="round_robin")
+
+    sessions = [RoutingSession(bind=primary, replicas=replica_set) for _ in range(2)]
+    for session in sessions:
+        for _ in range(3):
+            session.execute(select(literal(1)))
+    assert [engine.pool.checkedout() for engine in [primary, *replicas]] == [0, 1, 1]
+    assert sessions[0].info[REPLICA_KEY] is replicas[0]
+    assert sessions[1].info[REPLICA_KEY] is replicas[1]
+    for session in sessions:
+        session.close()
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from app.infrastructure.common.exceptions.http_exceptions import (
+    TooManyRequestsException,
+)
+from app.infrastructure.common.throttling import throttle as throttle_module
+from app.infrastructure.common.throttling.throttle import Throttle
+from app.infrastructure.common.throttling.token_bucket import (
+    InMemoryTokenBucketStore,
+    RateLimit,
+)
+from app.infrastructure.configs.app_config import Settings
+
+
+def test_zero_budget_disables_the_limit(monkeypatch):
+    monkeypatch.setattr(throttle_module.app_settings, "throttle_login_ip_per_minute", 0)
+    monkeypatch.setattr(
+        throttle_module.app_settings, "throttle_login_email_per_minute", 1
+    )
+    throttle = Throttle(store=InMemoryTokenBucketStore(max_keys=100))
+    assert "ip" not in throttle.budgets["login"]
+
+    async def run():
+        # The IP is unlimited, each email gets one attempt per minute.
+        for i in range(50):
+            await throttle.check("login", "10.0.0.1", f"user{i}@example.com")
+        with pytest.raises(TooManyRequestsException):
+            await throttle.check("login", "10.0.0.1", "user0@example.com")
+
+    asyncio.run(run())
+
+
+def test_non_positive_custom_budget_is_rejected():
+    with pytest.raises(ValueError):
+        Throttle(budgets={"login": {"ip": RateLimit(0)}})
+
+
+def test_negative_budget_setting_is_rejected():
+    with pytest.raises(ValidationError):
+        Settings(throttle_login_ip_per_minute=-1)
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm.exc import DetachedInstanceError
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.common.cache.cache_backend import InMemoryCacheBackend
+from app.infrastructure.common.metrics import app_metrics
+from app.infrastructure.configs.db_config import Base
+from app.infrastructure.entities.id_types import new_id
+from app.infrastructure.repositories.user_repository import UserRepository
+
+USER = {
+    "email": "cache@example.com",
+    "full_name": "Cache Test",
+    "hashed_password": "$2b$12$digest",
+    "is_active": True,
+    "is_admin": False,
+}
+
+
+def run_with_repository(scenario):
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        statements = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, sql, *args: statements.append(sql),
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        cache = InMemoryCacheBackend(max_entries=100, ttl_seconds=60)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                repo = UserRepository(session, cache=cache)
+                await repo.create({"id": new_id(), **USER})
+                await session.commit()
+                statements.clear()
+                await scenario(repo, cache, statements)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_secret_is_read_alone_on_a_hit():
+    async def scenario(repo, cache, statements):
+        user, digest = await repo.find_one_with_secret(
+            {"email": USER["email"]}, "hashed_password"
+        )
+        assert digest == USER["hashed_password"]
+        assert cache.stats()["misses"] == 1
+
+        statements.clear()
+        cached, digest = await repo.find_one_with_secret(
+            {"email": USER["email"]}, "hashed_password"
+        )
+        assert cached.id == user.id and digest == USER["hashed_password"]
+        assert cache.stats()["hits"] == 2  # the email pointer, then the row
+        assert len(statements) == 1
+        assert statements[0].startswith("SELECT users.hashed_password")
+
+    run_with_repository(scenario)
+
+
+def test_secrets_are_unreadable_on_a_miss_and_on_a_hit():
+    async def scenario(repo, cache, statements):
+        for _ in range(2):
+            user = await repo.find_one_by_filter({"email": USER["email"]})
+            assert user.full_name == USER["full_name"]
+            with pytest.raises(DetachedInstanceError):
+                user.hashed_password
+
+    run_with_repository(scenario)
+
+
+def test_secret_only_writes_keep_the_cached_row():
+    async def scenario(repo, cache, statements):
+        user = await repo.find_one_by_filter({"email": USER["email"]})
+        await repo.update_fields(user.id, {"hashed_refresh_token": "hmac$x"})
+        _, digest = await repo.find_one_with_secret(
+            {"id": user.id}, "hashed_refresh_token"
+        )
+        assert digest == "hmac$x"
+        assert cache.stats()["misses"] == 1
+
+        await repo.update_fields(user.id, {"full_name": "Renamed"})
+        assert (await repo.find_one_by_filter({"id": user.id})).full_name == "Renamed"
+        assert cache.stats()["misses"] == 2
+
+    run_with_repository(scenario)
+
+
+def test_cache_stats_are_exported(monkeypatch):
+    monkeypatch.setattr(app_metrics.registry, "_collectors", [])
+    cache = InMemoryCacheBackend(max_entries=1, ttl_seconds=60)
+
+    async def fill():
+        await cache.get("a")
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("b")
+
+    asyncio.run(fill())
+    app_metrics.instrument_cache(cache, "test")
+    merged = app_metrics.registry.collect()
+    assert merged["cache_lookups_total"][("test", "hit")] == 1
+    assert merged["cache_lookups_total"][("test", "miss")] == 1
+    assert merged["cache_evictions_total"][("test",)] == 1
+    assert merged["cache_entries"][("test",)] == 1